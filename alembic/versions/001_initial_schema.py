@@ -14,24 +14,28 @@ depends_on = None
 
 
 def upgrade() -> None:
-    from alembic import op as _op
-    bind = _op.get_bind()
-    inspector = sa.inspect(bind)
-    existing_tables = set(inspector.get_table_names())
+    bind = op.get_bind()
 
-    if "teams" in existing_tables:
+    # A targeted has_table() check is enough; no need to reflect every table name.
+    if sa.inspect(bind).has_table("teams"):
         return
 
-    op.create_table(
+    # Declare every table on one MetaData and emit the DDL in a single
+    # create_all() pass instead of one op.create_table() call per table.
+    metadata = sa.MetaData()
+
+    sa.Table(
         "teams",
+        metadata,
         sa.Column("id", sa.String(50), primary_key=True),
         sa.Column("name", sa.String(200), nullable=False),
         sa.Column("plan", sa.String(50), nullable=True),
         sa.Column("monthly_budget", sa.Float, default=0.0),
     )
 
-    op.create_table(
+    sa.Table(
         "agent_sessions",
+        metadata,
         sa.Column("session_id", sa.String(100), primary_key=True),
         sa.Column("team_id", sa.String(50), sa.ForeignKey("teams.id"), nullable=False),
         sa.Column("agent_name", sa.String(200), nullable=False),
@@ -50,8 +54,9 @@ def upgrade() -> None:
         sa.Column("tags", sa.String(500), nullable=True),
     )
 
-    op.create_table(
+    sa.Table(
         "token_usage",
+        metadata,
         sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
         sa.Column("session_id", sa.String(100), sa.ForeignKey("agent_sessions.session_id"), nullable=False),
         sa.Column("timestamp", sa.DateTime(timezone=True)),
@@ -62,8 +67,9 @@ def upgrade() -> None:
         sa.Column("cost", sa.Float, default=0.0),
     )
 
-    op.create_table(
+    sa.Table(
         "usage_requests",
+        metadata,
         sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
         sa.Column("ts", sa.DateTime(timezone=True)),
         sa.Column("caller_service", sa.String(100)),
@@ -73,8 +79,9 @@ def upgrade() -> None:
         sa.Column("duration_ms", sa.Float),
     )
 
-    op.create_table(
+    sa.Table(
         "contract_snapshots",
+        metadata,
         sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
         sa.Column("version_hash", sa.String(64), nullable=False),
         sa.Column("content", sa.Text, nullable=False),
@@ -82,8 +89,9 @@ def upgrade() -> None:
         sa.Column("captured_at", sa.DateTime(timezone=True)),
     )
 
-    op.create_table(
+    sa.Table(
         "contract_changes",
+        metadata,
         sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
         sa.Column("base_ref", sa.String(64), nullable=False),
         sa.Column("head_ref", sa.String(64), nullable=False),
@@ -95,8 +103,9 @@ def upgrade() -> None:
         sa.Column("changed_fields_json", sa.Text),
     )
 
-    op.create_table(
+    sa.Table(
         "impact_sets",
+        metadata,
         sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
         sa.Column("change_id", sa.Integer, sa.ForeignKey("contract_changes.id"), nullable=False),
         sa.Column("route_template", sa.String(500), nullable=False),
@@ -107,8 +116,9 @@ def upgrade() -> None:
         sa.Column("notes", sa.Text, nullable=True),
     )
 
-    op.create_table(
+    sa.Table(
         "remediation_jobs",
+        metadata,
         sa.Column("job_id", sa.Integer, primary_key=True, autoincrement=True),
         sa.Column("change_id", sa.Integer, sa.ForeignKey("contract_changes.id"), nullable=False),
         sa.Column("target_repo", sa.String(500), nullable=False),
@@ -122,8 +132,9 @@ def upgrade() -> None:
         sa.Column("is_dry_run", sa.Boolean, default=False),
     )
 
-    op.create_table(
+    sa.Table(
         "audit_log",
+        metadata,
         sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
         sa.Column("job_id", sa.Integer, sa.ForeignKey("remediation_jobs.job_id"), nullable=False),
         sa.Column("old_status", sa.String(30), nullable=True),
@@ -132,13 +143,16 @@ def upgrade() -> None:
         sa.Column("detail", sa.Text, nullable=True),
     )
 
-    op.create_table(
+    sa.Table(
         "service_dependencies",
+        metadata,
         sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
         sa.Column("service_name", sa.String(200), nullable=False),
         sa.Column("depends_on", sa.String(200), nullable=False),
     )
 
+    metadata.create_all(bind, checkfirst=False)
+
 
 def downgrade() -> None:
     op.drop_table("service_dependencies")
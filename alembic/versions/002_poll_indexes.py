@@ -0,0 +1,28 @@
+"""add indexes for wave polling and latest-snapshot lookup
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_remediation_jobs_poll", "remediation_jobs", ["status", "devin_run_id"])
+    op.create_index("ix_remediation_jobs_change_id", "remediation_jobs", ["change_id"])
+    op.create_index(
+        "ix_contract_snapshots_latest",
+        "contract_snapshots",
+        ["captured_at", "id", "version_hash"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contract_snapshots_latest", table_name="contract_snapshots")
+    op.drop_index("ix_remediation_jobs_change_id", table_name="remediation_jobs")
+    op.drop_index("ix_remediation_jobs_poll", table_name="remediation_jobs")
@@ -14,58 +14,79 @@ import argparse
 import asyncio
 import hashlib
 import json
+import logging
 import os
 import random
+import re
 import sys
-from datetime import datetime, timezone
+from collections import Counter
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+import orjson
 import yaml
+from sqlalchemy import Row, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Ensure the api-core src is importable
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from propagate.differ import diff_contracts, load_contract
-from propagate.classifier import classify_changes
-from propagate.impact import compute_impact_sets
-from propagate.service_map import load_service_map
-from propagate.bundle import build_fix_bundles
-from propagate.dispatcher import dispatch_remediation_jobs
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from propagate.differ import YamlLoader, diff_contracts
 from propagate.guardrails import load_guardrails
-from propagate.dependency_graph import build_dependency_graph_from_service_map, risk_weighted_sort
 from propagate.check_status import check_jobs, TERMINAL_STATUSES
 from propagate.devin_client import DevinClient
-from propagate.simulator import (
-    simulate_contract_changes,
-    format_blast_radius_table,
-    simulation_results_to_dicts,
-)
 
-from src.database import async_session, init_db
+from src.database import async_session, init_db, warm_pool
 from src.entities.contract_snapshot import ContractSnapshot
-from src.entities.contract_change import ContractChange
-from src.entities.impact_set import ImpactSet
 from src.entities.remediation_job import RemediationJob, JobStatus
-from src.entities.simulation import ContractSimulation
 
 
-CONTRACT_PATH = Path(__file__).resolve().parent.parent / "openapi.yaml"
+CONTRACT_PATH = _REPO_ROOT / "openapi.yaml"
+
+logger = logging.getLogger(__name__)
+
+_MERGED = JobStatus.MERGED.value
+
+# Per-service detail in step output; off by default to keep CI logs short.
+VERBOSE = os.getenv("PROPAGATE_VERBOSE", "false").lower() == "true"
+
+WAVE_POLL_BASE_INTERVAL = 2.0  # first wave poll delay (seconds)
+WAVE_POLL_BACKOFF = 1.6        # delay multiplier applied after each poll
+WAVE_POLL_MAX_INTERVAL = 60.0  # cap on the backoff delay (seconds)
+WAVE_TIMEOUT = 1800            # give up on a wave after 30 minutes
+WAVE_CONTEXT_CONCURRENCY = 8  # max in-flight context messages per wave
+WAVE_SESSION_FETCH_CONCURRENCY = 16  # max in-flight get_session calls per wave
+WAVE_SESSION_FETCH_TIMEOUT = 10  # per-session fetch budget (seconds)
 
-WAVE_POLL_INTERVAL = 30  # seconds between wave completion polls
-WAVE_MAX_POLLS = 60      # max polls (30 min timeout)
+# Changed-file token regexes mapped to the fix pattern they indicate.
+_FILE_PATTERN_RULES: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"client|gateway|http|api/"), "updated API client callsites"),
+    (re.compile(r"schema|pydantic|types|dto"), "updated schema/type contracts"),
+    (re.compile(r"route|handler|service"), "updated business logic adapters"),
+    (re.compile(r"test|spec|fixture|conftest"), "updated tests/fixtures for contract compatibility"),
+)
+
+_FIXTURE_PATH_RE = re.compile(r"fixture|conftest\.py")
+
+# Payload keys read by _extract_fix_insights, checked in order.
+_CHANGED_FILE_KEYS = ("changed_files", "files_changed", "modified_files")
+_PATTERN_KEYS = ("patterns_used", "applied_patterns", "fix_patterns")
+_FIXTURE_KEYS = ("test_fixtures_changed", "fixtures_changed")
+_SUMMARY_KEYS = ("change_summary", "summary", "fix_summary", "result_summary")
 
+# Simulated dry-run terminal states and their detail messages.
+DRY_RUN_OUTCOMES = {
+    "MERGED": "CI passed, PR ready for review",
+    "CI_FAILED": "CI failed: test assertions broke",
+    "NEEDS_HUMAN": "Devin session blocked, requires human review",
+}
 
-def _dedupe_keep_order(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
-    for value in values:
-        norm = value.strip()
-        if not norm or norm in seen:
-            continue
-        seen.add(norm)
-        result.append(norm)
-    return result
+
+def _version_hash(data: bytes) -> str:
+    """Return the 16-char snapshot version hash for raw contract bytes."""
+    return hashlib.sha256(data).digest()[:8].hex()
 
 
 def _as_string_list(value: Any) -> list[str]:
@@ -76,74 +97,73 @@ def _as_string_list(value: Any) -> list[str]:
     return []
 
 
-def _infer_patterns_from_files(changed_files: list[str]) -> list[str]:
-    patterns: list[str] = []
-    lowered = [path.lower() for path in changed_files]
+def _classify_files(changed_files: list[str], *, collect_fixtures: bool) -> tuple[list[str], list[str]]:
+    """Return (inferred fix patterns, fixture paths) from one lowercase pass over *changed_files*."""
+    remaining = list(_FILE_PATTERN_RULES)
+    matched: set[str] = set()
+    fixtures: list[str] = []
+    for path in changed_files:
+        lowered = path.lower()
+        if remaining:
+            for regex, label in remaining:
+                if regex.search(lowered):
+                    matched.add(label)
+            remaining = [rule for rule in remaining if rule[1] not in matched]
+        if collect_fixtures:
+            if _FIXTURE_PATH_RE.search(lowered):
+                fixtures.append(path)
+        elif not remaining:
+            break
 
-    if any(
-        token in path
-        for path in lowered
-        for token in ("client", "gateway", "http", "api/")
-    ):
-        patterns.append("updated API client callsites")
-    if any(
-        token in path
-        for path in lowered
-        for token in ("schema", "pydantic", "types", "dto")
-    ):
-        patterns.append("updated schema/type contracts")
-    if any(
-        token in path
-        for path in lowered
-        for token in ("route", "handler", "service")
-    ):
-        patterns.append("updated business logic adapters")
-    if any(
-        token in path
-        for path in lowered
-        for token in ("test", "spec", "fixture", "conftest")
-    ):
-        patterns.append("updated tests/fixtures for contract compatibility")
+    patterns = [label for _regex, label in _FILE_PATTERN_RULES if label in matched]
+    return patterns, fixtures
 
-    return patterns
+
+def _collect_strings(into: dict[str, None], value: Any) -> None:
+    """Add the stripped, non-empty strings in *value* to an ordered set."""
+    for item in _as_string_list(value):
+        norm = item.strip()
+        if norm:
+            into[norm] = None
 
 
 def _extract_fix_insights(session_payload: dict[str, Any]) -> dict[str, Any]:
     structured = session_payload.get("structured_output")
     if not isinstance(structured, dict):
         structured = {}
-
-    changed_files: list[str] = []
-    for key in ("changed_files", "files_changed", "modified_files"):
-        changed_files.extend(_as_string_list(structured.get(key)))
-        changed_files.extend(_as_string_list(session_payload.get(key)))
+    sources = (structured, session_payload)
+
+    changed_files: dict[str, None] = {}
+    patterns: dict[str, None] = {}
+    fixtures: dict[str, None] = {}
+    for keys, into in (
+        (_CHANGED_FILE_KEYS, changed_files),
+        (_PATTERN_KEYS, patterns),
+        (_FIXTURE_KEYS, fixtures),
+    ):
+        for key in keys:
+            for source in sources:
+                _collect_strings(into, source.get(key))
     changes = structured.get("changes")
     if isinstance(changes, list):
         for change in changes:
             if isinstance(change, dict):
-                changed_files.extend(_as_string_list(change.get("files")))
-                changed_files.extend(_as_string_list(change.get("changed_files")))
-    changed_files = _dedupe_keep_order(changed_files)
-
-    explicit_patterns: list[str] = []
-    for key in ("patterns_used", "applied_patterns", "fix_patterns"):
-        explicit_patterns.extend(_as_string_list(structured.get(key)))
-        explicit_patterns.extend(_as_string_list(session_payload.get(key)))
-
-    test_fixtures_changed: list[str] = []
-    for key in ("test_fixtures_changed", "fixtures_changed"):
-        test_fixtures_changed.extend(_as_string_list(structured.get(key)))
-        test_fixtures_changed.extend(_as_string_list(session_payload.get(key)))
-    if not test_fixtures_changed:
-        test_fixtures_changed = [
-            path
-            for path in changed_files
-            if any(token in path.lower() for token in ("/fixtures/", "\\fixtures\\", "fixture", "conftest.py"))
-        ]
-    test_fixtures_changed = _dedupe_keep_order(test_fixtures_changed)
+                _collect_strings(changed_files, change.get("files"))
+                _collect_strings(changed_files, change.get("changed_files"))
+
+    # Any reported fixture value, even a blank one, suppresses inference: the
+    # session spoke for its fixtures, so they are not guessed from file names.
+    fixtures_reported = any(
+        _as_string_list(source.get(key)) for key in _FIXTURE_KEYS for source in sources
+    )
+    inferred_patterns, inferred_fixtures = _classify_files(
+        list(changed_files), collect_fixtures=not fixtures_reported
+    )
+    if not fixtures_reported:
+        fixtures = dict.fromkeys(inferred_fixtures)
 
     change_summary = ""
-    for key in ("change_summary", "summary", "fix_summary", "result_summary"):
+    for key in _SUMMARY_KEYS:
         value = structured.get(key)
         if isinstance(value, str) and value.strip():
             change_summary = value.strip()
@@ -153,47 +173,56 @@ def _extract_fix_insights(session_payload: dict[str, Any]) -> dict[str, Any]:
             change_summary = value.strip()
             break
 
-    patterns_used = _dedupe_keep_order(explicit_patterns + _infer_patterns_from_files(changed_files))
+    patterns.update(dict.fromkeys(inferred_patterns))
 
     return {
-        "patterns_used": patterns_used,
-        "test_fixtures_changed": test_fixtures_changed,
-        "changed_files": changed_files,
+        "patterns_used": list(patterns),
+        "test_fixtures_changed": list(fixtures),
+        "changed_files": list(changed_files),
         "change_summary": change_summary,
     }
 
 
-async def _build_wave_context_payload(job_ids: list[int], wave_idx: int) -> dict[str, Any] | None:
-    """Build structured context from completed wave outputs for the next wave."""
+async def _build_wave_context_payload(
+    db: AsyncSession,
+    client: DevinClient,
+    job_ids: list[int],
+    wave_idx: int,
+) -> dict[str, Any] | None:
+    """Build structured context from completed wave outputs for the next wave.
+
+    *client* is owned by the caller and left open.
+    """
     if not job_ids:
         return None
 
-    from sqlalchemy import select
-
-    async with async_session() as db:
-        result = await db.execute(
-            select(RemediationJob).where(RemediationJob.job_id.in_(job_ids))
-        )
-        finished_jobs = list(result.scalars().all())
+    # Only the columns the summaries use; skips prompt/error_summary and ORM hydration.
+    result = await db.execute(
+        select(
+            RemediationJob.target_repo,
+            RemediationJob.status,
+            RemediationJob.pr_url,
+            RemediationJob.devin_run_id,
+        ).where(RemediationJob.job_id.in_(job_ids))
+    )
+    finished_jobs = result.all()
 
     if not finished_jobs:
         return None
 
-    client: DevinClient | None = None
-    try:
-        client = DevinClient()
-    except Exception:
-        client = None
+    semaphore = asyncio.Semaphore(WAVE_SESSION_FETCH_CONCURRENCY)
 
-    async def build_one(job: RemediationJob) -> dict[str, Any]:
-        payload: dict[str, Any] = {}
-        if client is not None and job.devin_run_id:
-            try:
-                payload = await client.get_session(job.devin_run_id)
-            except Exception:
-                payload = {}
+    async def fetch_session(session_id: str) -> dict[str, Any]:
+        # A slow session only loses its own insights instead of stalling the wave.
+        try:
+            async with semaphore, asyncio.timeout(WAVE_SESSION_FETCH_TIMEOUT):
+                return await client.get_session(session_id)
+        except Exception:
+            return {}
+
+    def summarize(job: Row, payload: dict[str, Any]) -> dict[str, Any]:
         insights = _extract_fix_insights(payload)
-        repo_name = job.target_repo.rstrip("/").split("/")[-1] or job.target_repo
+        repo_name = job.target_repo.rstrip("/").rsplit("/", 1)[-1] or job.target_repo
         return {
             "repo": repo_name,
             "status": job.status,
@@ -204,32 +233,26 @@ async def _build_wave_context_payload(job_ids: list[int], wave_idx: int) -> dict
             "change_summary": insights["change_summary"],
         }
 
-    try:
-        upstream_fix_summaries = list(await asyncio.gather(*(build_one(job) for job in finished_jobs)))
-    finally:
-        if client is not None:
-            await client.close()
-
-    notable_patterns = _dedupe_keep_order(
-        [
-            pattern
-            for item in upstream_fix_summaries
-            for pattern in item.get("patterns_used", [])
-            if isinstance(pattern, str)
-        ]
-    )
-    test_fixtures_changed = _dedupe_keep_order(
-        [
-            fixture
-            for item in upstream_fix_summaries
-            for fixture in item.get("test_fixtures_changed", [])
-            if isinstance(fixture, str)
-        ]
-    )
+    # Only jobs with a Devin session need a network round-trip; the rest are
+    # summarized from their row without scheduling a coroutine.
+    session_ids = [job.devin_run_id for job in finished_jobs if job.devin_run_id]
+    payloads = iter(await asyncio.gather(*map(fetch_session, session_ids)) if session_ids else ())
+    upstream_fix_summaries = [
+        summarize(job, next(payloads) if job.devin_run_id else {})
+        for job in finished_jobs
+    ]
+
+    # Per-job lists are already stripped and deduplicated by _extract_fix_insights.
+    notable_patterns = list(dict.fromkeys(chain.from_iterable(
+        item["patterns_used"] for item in upstream_fix_summaries
+    )))
+    test_fixtures_changed = list(dict.fromkeys(chain.from_iterable(
+        item["test_fixtures_changed"] for item in upstream_fix_summaries
+    )))
     ci_green_prs = [
         item["pr_url"]
         for item in upstream_fix_summaries
-        if item.get("status") == JobStatus.MERGED.value and isinstance(item.get("pr_url"), str) and item["pr_url"]
+        if item.get("status") == _MERGED and isinstance(item.get("pr_url"), str) and item["pr_url"]
     ]
 
     status_parts = [
@@ -257,39 +280,50 @@ async def _build_wave_context_payload(job_ids: list[int], wave_idx: int) -> dict
     }
 
 
-async def _wait_for_wave_completion(job_ids: list[int], wave_idx: int) -> bool:
+async def _wait_for_wave_completion(db: AsyncSession, job_ids: list[int], wave_idx: int) -> bool:
     """Poll until all jobs in the wave reach a terminal status.
 
-    Returns True if all jobs completed, False on timeout.
+    Returns True if all jobs completed, False on timeout. The poll delay
+    backs off exponentially so short waves finish quickly while long waves
+    issue fewer queries.
     """
-    from sqlalchemy import select
+    count_q = (
+        select(func.count())
+        .select_from(RemediationJob)
+        .where(
+            RemediationJob.job_id.in_(job_ids),
+            RemediationJob.status.notin_(TERMINAL_STATUSES),
+            RemediationJob.devin_run_id.isnot(None),
+        )
+    )
 
-    for poll in range(WAVE_MAX_POLLS):
-        await asyncio.sleep(WAVE_POLL_INTERVAL)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + WAVE_TIMEOUT
+    delay = WAVE_POLL_BASE_INTERVAL
+    poll = 0
+    while loop.time() < deadline:
+        await asyncio.sleep(min(delay, max(0.0, deadline - loop.time())))
+        delay = min(delay * WAVE_POLL_BACKOFF, WAVE_POLL_MAX_INTERVAL)
+        poll += 1
         try:
             await check_jobs()
         except Exception as e:
-            print(f"  Wave {wave_idx} poll error: {e}")
+            logger.warning("  Wave %d poll error: %s", wave_idx, e)
 
-        async with async_session() as db:
-            result = await db.execute(
-                select(RemediationJob).where(
-                    RemediationJob.job_id.in_(job_ids),
-                    RemediationJob.status.notin_(TERMINAL_STATUSES),
-                    RemediationJob.devin_run_id.isnot(None),
-                )
-            )
-            pending = list(result.scalars().all())
-            if not pending:
-                print(f"  Wave {wave_idx} complete — all jobs reached terminal status")
-                return True
-            print(f"  Wave {wave_idx} poll {poll + 1}: {len(pending)} job(s) still running")
+        pending = (await db.execute(count_q)).scalar_one()
+        # End the read transaction so it is not held open across the sleep.
+        await db.commit()
+        if not pending:
+            logger.info("  Wave %d complete — all jobs reached terminal status", wave_idx)
+            return True
+        logger.info("  Wave %d poll %d: %d job(s) still running", wave_idx, poll, pending)
 
-    print(f"  Wave {wave_idx} timed out after {WAVE_MAX_POLLS} polls")
+    logger.warning("  Wave %d timed out after %ss (%d polls)", wave_idx, WAVE_TIMEOUT, poll)
     return False
 
 
 async def _send_context_to_wave(
+    client: DevinClient,
     wave_jobs: list[RemediationJob],
     wave_idx: int,
     context_payload: dict[str, Any] | None,
@@ -318,23 +352,24 @@ async def _send_context_to_wave(
         "ci_green_prs": context_payload.get("ci_green_prs", []),
     }
 
-    client = DevinClient()
     print(f"  Sending prior-wave context to wave {wave_idx} ({len(session_ids)} session(s))...")
 
+    semaphore = asyncio.Semaphore(WAVE_CONTEXT_CONCURRENCY)
+
     async def send_one(session_id: str) -> None:
-        try:
-            await client.send_message(
-                session_id,
-                summary_text,
-                wave_context=wave_context,
-            )
-        except Exception as e:
-            print(f"    Context message failed for {session_id}: {e}")
+        async with semaphore:
+            try:
+                await client.send_message(
+                    session_id,
+                    summary_text,
+                    wave_context=wave_context,
+                )
+            except Exception as e:
+                logger.warning("    Context message failed for %s: %s", session_id, e)
 
-    try:
-        await asyncio.gather(*(send_one(session_id) for session_id in session_ids))
-    finally:
-        await client.close()
+    async with asyncio.TaskGroup() as tg:
+        for session_id in session_ids:
+            tg.create_task(send_one(session_id))
 
 
 async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
@@ -356,20 +391,26 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
         print(f"ERROR: Contract file not found at {CONTRACT_PATH}")
         sys.exit(1)
 
-    new_content = CONTRACT_PATH.read_text()
-    new_spec = yaml.safe_load(new_content)
-    new_hash = hashlib.sha256(new_content.encode()).hexdigest()[:16]
+    # Read the file once; hash and parse the raw bytes (the C loader accepts
+    # bytes directly). Parsing runs in a thread so it overlaps the snapshot query.
+    new_bytes = await asyncio.to_thread(CONTRACT_PATH.read_bytes)
+    new_spec_task = asyncio.create_task(asyncio.to_thread(yaml.load, new_bytes, YamlLoader))
+    new_content = new_bytes.decode("utf-8")
+    new_hash = _version_hash(new_bytes)
     print(f"\nNew contract hash: {new_hash}")
 
     # Load old contract from DB (most recent snapshot)
     async with async_session() as db:
-        from sqlalchemy import select
+        # Hash only: the (possibly large) content column is fetched below
+        # once the contract is known to have changed.
         result = await db.execute(
-            select(ContractSnapshot)
+            select(ContractSnapshot.id, ContractSnapshot.version_hash)
             .order_by(ContractSnapshot.captured_at.desc())
             .limit(1)
         )
-        old_snapshot = result.scalar_one_or_none()
+        old_snapshot = result.first()
+        # Await before any snapshot is written so an unparseable contract still aborts.
+        new_spec = await new_spec_task
 
         if old_snapshot is None:
             if ci:
@@ -378,14 +419,14 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
                 old_spec = {"openapi": "3.1.0", "info": {}, "paths": {}}
                 # Store the empty baseline
                 empty_content = json.dumps(old_spec)
-                empty_hash = hashlib.sha256(empty_content.encode()).hexdigest()[:16]
+                empty_hash = _version_hash(empty_content.encode())
                 baseline = ContractSnapshot(
                     version_hash=empty_hash,
                     content=empty_content,
                     git_sha=os.getenv("GITHUB_SHA", ""),
                 )
+                # Flushed together with the ContractChange below.
                 db.add(baseline)
-                await db.flush()
             else:
                 print("No previous contract snapshot found. Storing current as baseline.")
                 snapshot = ContractSnapshot(
@@ -403,15 +444,41 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
                 print("Contract unchanged. Nothing to propagate.")
                 return
 
-            old_spec = yaml.safe_load(old_snapshot.content)
+            old_content = (
+                await db.execute(select(ContractSnapshot.content).where(ContractSnapshot.id == old_snapshot.id))
+            ).scalar_one()
+            # Parse the old spec while the pipeline modules below are imported.
+            old_spec_task = asyncio.create_task(
+                asyncio.to_thread(yaml.load, old_content, YamlLoader)
+            )
             print(f"Old contract hash: {old_snapshot.version_hash}")
 
+        # Pipeline-only modules are imported here so the baseline and
+        # unchanged-contract exits above never pay for loading them.
+        from propagate.bundle import RepoFixBundle, build_fix_bundles
+        from propagate.classifier import classify_changes
+        from propagate.dependency_graph import build_dependency_graph_from_service_map, risk_weighted_sort
+        from propagate.dispatcher import dispatch_remediation_jobs, guardrail_target_paths
+        from propagate.impact import compute_impact_sets
+        from propagate.service_map import load_service_map
+        from propagate.simulator import (
+            simulate_contract_changes,
+            format_blast_radius_table,
+            simulation_results_to_dicts,
+        )
+        from src.entities.contract_change import ContractChange
+        from src.entities.impact_set import ImpactSet
+        from src.entities.simulation import ContractSimulation
+
+        if old_snapshot is not None:
+            old_spec = await old_spec_task
+
         # Step 1: Diff contracts
         print("\n--- STEP 1: Diffing contracts ---")
         diffs = diff_contracts(old_spec, new_spec)
         print(f"  Found {len(diffs)} diff(s)")
         for d in diffs:
-            print(f"    {d.method.upper()} {d.path} / {d.field}: {d.diff_type}")
+            logger.info("    %s %s / %s: %s", d.method.upper(), d.path, d.field, d.diff_type)
 
         if not diffs:
             print("No meaningful diffs found. Updating snapshot.")
@@ -424,6 +491,10 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
             await db.commit()
             return
 
+        # Pre-open connections for the concurrent dispatch/poll phases; the
+        # baseline, unchanged-contract and no-diff exits above skip this.
+        await warm_pool(guardrails.max_parallel)
+
         print("\n  [pausing 5s before next step...]")
         await asyncio.sleep(5)
 
@@ -441,9 +512,9 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
             head_ref=new_hash,
             is_breaking=classified.is_breaking,
             severity=classified.severity,
-            summary_json=json.dumps({"summary": classified.summary}),
-            changed_routes_json=json.dumps(classified.changed_routes),
-            changed_fields_json=json.dumps(classified.changed_fields),
+            summary_json=orjson.dumps({"summary": classified.summary}).decode(),
+            changed_routes_json=orjson.dumps(classified.changed_routes).decode(),
+            changed_fields_json=orjson.dumps(classified.changed_fields).decode(),
         )
         db.add(change)
         await db.flush()
@@ -459,28 +530,36 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
         svc_map = load_service_map()
         declared_dependents = {
             name for name, info in svc_map.items()
-            if "api-core" in info.depends_on
+            if "api-core" in info.depends_on_set
         }
         impacts = await compute_impact_sets(
             db, classified.changed_routes, declared_dependents
         )
         print(f"  Found {len(impacts)} impacted caller(s):")
         for imp in impacts:
-            calls_str = f"{imp.calls_last_7d} calls/7d" if imp.calls_last_7d else "declared dependent"
-            print(f"    {imp.caller_service} → {imp.route_template} ({calls_str})")
-
-            # Store impact set
-            impact_row = ImpactSet(
-                change_id=change.id,
-                route_template=imp.route_template,
-                method=imp.method,
-                caller_service=imp.caller_service,
-                calls_last_7d=imp.calls_last_7d,
-                confidence="high",
+            logger.info(
+                "    %s → %s (%s)",
+                imp.caller_service,
+                imp.route_template,
+                f"{imp.calls_last_7d} calls/7d" if imp.calls_last_7d else "declared dependent",
             )
-            db.add(impact_row)
 
-        await db.flush()
+        # Store impact sets in a single executemany instead of one INSERT per row
+        if impacts:
+            await db.execute(
+                insert(ImpactSet),
+                [
+                    {
+                        "change_id": change.id,
+                        "route_template": imp.route_template,
+                        "method": imp.method,
+                        "caller_service": imp.caller_service,
+                        "calls_last_7d": imp.calls_last_7d,
+                        "confidence": "high",
+                    }
+                    for imp in impacts
+                ],
+            )
 
         if not impacts:
             print("  No impacted services found. Updating snapshot.")
@@ -492,16 +571,17 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
             db.add(snapshot)
             await db.commit()
             return
-        await db.flush()
-        await db.commit()  # release SQLite write lock before remediation_jobs inserts
 
         print("\n  [pausing 5s before next step...]")
         await asyncio.sleep(5)
 
         # Step 4: Build dependency graph from already-loaded service map
         print("\n--- STEP 4: Loading service map & dependency graph ---")
-        for name, info in svc_map.items():
-            print(f"  {name} → {info.repo} (depends_on: {info.depends_on})")
+        if VERBOSE:
+            for name, info in svc_map.items():
+                logger.info("  %s → %s (depends_on: %s)", name, info.repo, info.depends_on)
+        else:
+            print(f"  {len(svc_map)} service(s) loaded (PROPAGATE_VERBOSE=true to list them)")
 
         dep_graph = build_dependency_graph_from_service_map(svc_map)
         waves = dep_graph.topological_sort()
@@ -515,30 +595,23 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
         sim_results = simulate_contract_changes(diffs, svc_map)
         print(format_blast_radius_table(sim_results))
 
-        # Store simulation results
-        for sim in sim_results:
-            sim_row = ContractSimulation(
-                change_id=change.id,
-                service_name=sim.service,
-                risk_score=sim.risk_score,
-                risk_level=sim.risk_level,
-                breaking_issues_json=json.dumps([
+        # Store simulation results in one executemany
+        if sim_results:
+            await db.execute(
+                insert(ContractSimulation),
+                [
                     {
-                        "diff_type": issue.diff_type,
-                        "path": issue.path,
-                        "method": issue.method,
-                        "field": issue.field,
-                        "detail": issue.detail,
-                        "weight": issue.weight,
+                        "change_id": change.id,
+                        "service_name": sim["service"],
+                        "risk_score": sim["risk_score"],
+                        "risk_level": sim["risk_level"],
+                        "breaking_issues_json": orjson.dumps(sim["breaking_issues"]).decode(),
+                        "fields_affected": sim["fields_affected"],
+                        "routes_affected": sim["routes_affected"],
                     }
-                    for issue in sim.breaking_issues
-                ]),
-                fields_affected=sim.fields_affected,
-                routes_affected=sim.routes_affected,
+                    for sim in simulation_results_to_dicts(sim_results)
+                ],
             )
-            db.add(sim_row)
-
-        await db.flush()
 
         # Apply risk-weighted wave ordering
         risk_scores = {s.service: s.risk_score for s in sim_results}
@@ -552,10 +625,10 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
         print("\n--- STEP 5: Building fix bundles ---")
         bundles = build_fix_bundles(classified, impacts, svc_map)
         for b in bundles:
-            print(f"  [{b.target_service}] {b.target_repo}")
-            print(f"    Routes: {b.affected_routes}")
-            print(f"    Calls (7d): {b.call_count_7d}")
-            print(f"    Bundle hash: {b.bundle_hash}")
+            logger.info(
+                "  [%s] %s\n    Routes: %s\n    Calls (7d): %d\n    Bundle hash: %s",
+                b.target_service, b.target_repo, b.affected_routes, b.call_count_7d, b.bundle_hash,
+            )
 
         print("\n  [pausing 5s before next step...]")
         await asyncio.sleep(5)
@@ -564,129 +637,156 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
         print("\n--- STEP 6: Dispatching Devin jobs (wave-ordered) ---")
         jobs = []
         bundle_by_service = {b.target_service: b for b in bundles}
+        # Resolve each wave's bundles once; both dispatch paths index this by wave.
+        waves_bundles: list[list[RepoFixBundle]] = [
+            [bundle_by_service[svc] for svc in wave_services if svc in bundle_by_service]
+            for wave_services in waves
+        ]
 
         if dry_run:
             print("  [DRY-RUN] Simulating dispatch — no API calls will be made")
             sim_results = []
-            for wave_idx, wave_services in enumerate(waves):
-                wave_bundles = [
-                    bundle_by_service[svc]
-                    for svc in wave_services
-                    if svc in bundle_by_service
-                ]
+            sim_job_rows: list[dict[str, Any]] = []
+            # Validate each bundle's target paths once; both loops below reuse it.
+            violations_by_service = {
+                b.target_service: guardrails.validate_paths(guardrail_target_paths(b))
+                for b in bundles
+            }
+            for wave_idx, wave_bundles in enumerate(waves_bundles):
                 if not wave_bundles:
                     continue
                 print(f"\n  Wave {wave_idx}: {[b.target_service for b in wave_bundles]}")
                 for b in wave_bundles:
-                    guardrail_paths = sorted(set(b.client_paths + b.test_paths + b.frontend_paths))
-                    violations = guardrails.validate_paths(guardrail_paths)
+                    violations = violations_by_service[b.target_service]
                     if violations:
-                        print(f"    [{b.target_service}] WOULD BE BLOCKED: {violations}")
+                        logger.info("    [%s] WOULD BE BLOCKED: %s", b.target_service, violations)
                         # Store blocked simulation result
-                        sim_job = RemediationJob(
-                            change_id=change.id,
-                            target_repo=b.target_repo,
-                            status="needs_human",
-                            bundle_hash=b.bundle_hash,
-                            error_summary=f"Guardrail violation: {'; '.join(violations)}",
-                            is_dry_run=True,
-                        )
-                        db.add(sim_job)
+                        sim_job_rows.append({
+                            "change_id": change.id,
+                            "target_repo": b.target_repo,
+                            "status": "needs_human",
+                            "bundle_hash": b.bundle_hash,
+                            "error_summary": f"Guardrail violation: {'; '.join(violations)}",
+                            "is_dry_run": True,
+                        })
                         sim_results.append((b.target_service, "NEEDS_HUMAN", 0, "guardrail blocked"))
                     else:
-                        print(f"    [{b.target_service}] → {b.target_repo}")
-                        print(f"      Prompt length: {len(b.prompt)} chars")
-                        print(f"      Affected routes: {b.affected_routes}")
+                        logger.info(
+                            "    [%s] → %s\n      Prompt length: %d chars\n      Affected routes: %s",
+                            b.target_service, b.target_repo, len(b.prompt), b.affected_routes,
+                        )
 
             # Simulate realistic randomized lifecycle
             print("\n--- STEP 6b: Simulated check_status lifecycle ---")
-            for b in bundles:
-                guardrail_paths = sorted(set(b.client_paths + b.test_paths + b.frontend_paths))
-                violations = guardrails.validate_paths(guardrail_paths)
-                if violations:
-                    continue
-
-                # Randomized terminal state: GREEN 60%, CI_FAILED 20%, NEEDS_HUMAN 20%
-                roll = random.random()
-                if roll < 0.6:
-                    terminal = "MERGED"
-                    detail = "CI passed, PR ready for review"
-                elif roll < 0.8:
-                    terminal = "CI_FAILED"
-                    detail = "CI failed: test assertions broke"
-                else:
-                    terminal = "NEEDS_HUMAN"
-                    detail = "Devin session blocked, requires human review"
-
-                duration_min = random.randint(15, 90)
-
-                print(f"  [{b.target_service}] QUEUED -> RUNNING -> AWAITING_MERGE -> {terminal} ({duration_min}m)")
-                print(f"    {detail}")
-
-                sim_job = RemediationJob(
-                    change_id=change.id,
-                    target_repo=b.target_repo,
-                    status=terminal.lower(),
-                    bundle_hash=b.bundle_hash,
-                    is_dry_run=True,
-                    error_summary=detail if terminal != "MERGED" else None,
-                )
-                db.add(sim_job)
-                sim_results.append((b.target_service, terminal, duration_min, detail))
+            simulated = [b for b in bundles if not violations_by_service[b.target_service]]
+            # Randomized terminal state: MERGED 60%, CI_FAILED 20%, NEEDS_HUMAN 20%,
+            # drawn for every bundle in one call rather than per iteration.
+            rng = random.Random()
+            terminals = rng.choices(
+                tuple(DRY_RUN_OUTCOMES), weights=(0.6, 0.2, 0.2), k=len(simulated)
+            )
+            durations = rng.choices(range(15, 91), k=len(simulated))
+            lifecycle = [
+                (b, terminal, duration_min, DRY_RUN_OUTCOMES[terminal])
+                for b, terminal, duration_min in zip(simulated, terminals, durations)
+            ]
+            # One write for the whole lifecycle listing, built only if it will be shown.
+            if lifecycle and logger.isEnabledFor(logging.INFO):
+                logger.info("\n".join(
+                    f"  [{b.target_service}] QUEUED -> RUNNING -> AWAITING_MERGE -> {terminal} ({duration_min}m)"
+                    f"\n    {detail}"
+                    for b, terminal, duration_min, detail in lifecycle
+                ))
+            sim_job_rows.extend(
+                {
+                    "change_id": change.id,
+                    "target_repo": b.target_repo,
+                    "status": terminal.lower(),
+                    "bundle_hash": b.bundle_hash,
+                    "is_dry_run": True,
+                    "error_summary": detail if terminal != "MERGED" else None,
+                }
+                for b, terminal, _duration_min, detail in lifecycle
+            )
+            sim_results.extend(
+                (b.target_service, terminal, duration_min, detail)
+                for b, terminal, duration_min, detail in lifecycle
+            )
 
-            await db.flush()
+            if sim_job_rows:
+                await db.execute(insert(RemediationJob), sim_job_rows)
 
             # Print summary table
-            print(f"\n{'='*60}")
-            print("DRY-RUN SIMULATION SUMMARY")
-            print(f"{'='*60}")
-            print(f"  {'Service':<25} {'Status':<15} {'Time':<8} Detail")
-            print(f"  {'-'*25} {'-'*15} {'-'*8} {'-'*30}")
-            for svc, status, mins, detail in sim_results:
-                time_str = f"{mins}m" if mins else "—"
-                print(f"  {svc:<25} {status:<15} {time_str:<8} {detail[:40]}")
-
-            merged = sum(1 for _, s, _, _ in sim_results if s == "MERGED")
-            failed = sum(1 for _, s, _, _ in sim_results if s == "CI_FAILED")
-            human = sum(1 for _, s, _, _ in sim_results if s == "NEEDS_HUMAN")
-            print(f"\n  Totals: {merged} MERGED, {failed} CI_FAILED, {human} NEEDS_HUMAN")
+            table = [
+                f"\n{'='*60}",
+                "DRY-RUN SIMULATION SUMMARY",
+                f"{'='*60}",
+                f"  {'Service':<25} {'Status':<15} {'Time':<8} Detail",
+                f"  {'-'*25} {'-'*15} {'-'*8} {'-'*30}",
+            ]
+            table.extend(
+                f"  {svc:<25} {status:<15} {f'{mins}m' if mins else '—':<8} {detail[:40]}"
+                for svc, status, mins, detail in sim_results
+            )
+            totals = Counter(status for _, status, _, _ in sim_results)
+            table.append(
+                f"\n  Totals: {totals['MERGED']} MERGED, {totals['CI_FAILED']} CI_FAILED, "
+                f"{totals['NEEDS_HUMAN']} NEEDS_HUMAN"
+            )
+            print("\n".join(table))
             print(f"\n[DRY-RUN] Pipeline complete. {len(bundles)} bundle(s) simulated.")
 
             print("\n  [pausing 5s before next step...]")
             await asyncio.sleep(5)
         else:
-            next_wave_context: dict[str, Any] | None = None
-            for wave_idx, wave_services in enumerate(waves):
-                wave_bundles = [
-                    bundle_by_service[svc]
-                    for svc in wave_services
-                    if svc in bundle_by_service
-                ]
-                if not wave_bundles:
-                    continue
-                print(f"\n  Wave {wave_idx}: {[b.target_service for b in wave_bundles]}")
-                wave_jobs = await dispatch_remediation_jobs(
-                    wave_bundles, guardrails, change.id, wave_context_payload=next_wave_context
-                )
-                jobs.extend(wave_jobs)
-
-                # After upstream wave completion, send context to newly dispatched wave.
-                await _send_context_to_wave(
-                    wave_jobs=wave_jobs,
-                    wave_idx=wave_idx,
-                    context_payload=next_wave_context,
-                )
+            # Commit before dispatch: the dispatcher writes remediation_jobs from its
+            # own sessions, which need to see this change row (FK) and cannot take
+            # the SQLite write lock while this transaction holds it, even under WAL.
+            await db.commit()
+            # One client (and connection pool) for every dispatch, context
+            # message and session fetch across all waves.
+            async with DevinClient() as client:
+                next_wave_context: dict[str, Any] | None = None
+                for wave_idx, wave_bundles in enumerate(waves_bundles):
+                    if not wave_bundles:
+                        continue
+                    print(f"\n  Wave {wave_idx}: {[b.target_service for b in wave_bundles]}")
+                    wave_jobs = await dispatch_remediation_jobs(
+                        wave_bundles, guardrails, change.id,
+                        wave_context_payload=next_wave_context, client=client,
+                    )
+                    jobs.extend(wave_jobs)
 
-                # Wait for wave completion before proceeding (including the final wave)
-                if not no_wait:
                     dispatched_ids = [j.job_id for j in wave_jobs if j.devin_run_id]
-                    if dispatched_ids:
-                        next_label = f"wave {wave_idx + 1}" if wave_idx < len(waves) - 1 else "snapshot advancement"
-                        print(f"\n  Waiting for wave {wave_idx} to complete before {next_label}...")
-                        await _wait_for_wave_completion(dispatched_ids, wave_idx)
+                    if no_wait or not dispatched_ids:
+                        # After upstream wave completion, send context to newly dispatched wave.
+                        await _send_context_to_wave(
+                            client=client,
+                            wave_jobs=wave_jobs,
+                            wave_idx=wave_idx,
+                            context_payload=next_wave_context,
+                        )
+                        continue
+
+                    # Wait for wave completion before proceeding (including the final wave)
+                    next_label = f"wave {wave_idx + 1}" if wave_idx < len(waves) - 1 else "snapshot advancement"
+                    print(f"\n  Waiting for wave {wave_idx} to complete before {next_label}...")
+                    # One session serves both the completion polls and the
+                    # context build for this wave.
+                    async with async_session() as wave_db:
+                        # Deliver upstream context while the first completion poll
+                        # is already counting down, rather than one after the other.
+                        async with asyncio.TaskGroup() as tg:
+                            tg.create_task(_send_context_to_wave(
+                                client=client,
+                                wave_jobs=wave_jobs,
+                                wave_idx=wave_idx,
+                                context_payload=next_wave_context,
+                            ))
+                            tg.create_task(_wait_for_wave_completion(wave_db, dispatched_ids, wave_idx))
                         if wave_idx < len(waves) - 1:
                             next_wave_context = await _build_wave_context_payload(
-                                dispatched_ids, wave_idx
+                                wave_db, client, dispatched_ids, wave_idx
                             )
 
         print("\n  [pausing 5s before next step...]")
@@ -705,16 +805,23 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
         elif jobs:
             job_ids = [j.job_id for j in jobs]
             result = await db.execute(
-                select(RemediationJob).where(RemediationJob.job_id.in_(job_ids))
+                select(
+                    RemediationJob.job_id,
+                    RemediationJob.target_repo,
+                    RemediationJob.status,
+                    RemediationJob.error_summary,
+                ).where(
+                    RemediationJob.job_id.in_(job_ids),
+                    RemediationJob.status.in_((JobStatus.CI_FAILED.value, JobStatus.NEEDS_HUMAN.value)),
+                )
             )
-            fresh_jobs = result.scalars().all()
-            unresolved = [j for j in fresh_jobs if j.status in {"ci_failed", "needs_human"}]
+            unresolved = result.all()
             if unresolved:
                 should_store_snapshot = False
                 fail_pipeline = True
                 print(f"\nWARNING: {len(unresolved)} job(s) in unresolved terminal state — snapshot NOT advanced.")
-                for j in unresolved:
-                    print(f"  [{j.target_repo}] status={j.status}: {j.error_summary or ''}")
+                for _job_id, target_repo, status, error_summary in unresolved:
+                    logger.warning("  [%s] status=%s: %s", target_repo, status, error_summary or "")
                 print("Resolve these jobs before re-running. The same contract hash will re-trigger on next push.\n")
 
         if not should_store_snapshot:
@@ -738,6 +845,24 @@ async def main(dry_run: bool = False, no_wait: bool = False, ci: bool = False):
             print(f"Propagation complete. {len(jobs)} job(s) dispatched.")
 
 
+def _configure_logging() -> None:
+    """Send per-item pipeline and wave-polling progress to stdout as bare lines.
+
+    Only this module's logger and check_status's (whose per-job transitions
+    show up during wave waits) are wired up, so they stay interleaved with the
+    step headers printed by main() and can be silenced with
+    PROPAGATE_LOG_LEVEL. Other propagate.* loggers are left as they were.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    level = os.environ.get("PROPAGATE_LOG_LEVEL", "INFO").upper()
+    for name in (__name__, "propagate.check_status"):
+        progress_logger = logging.getLogger(name)
+        progress_logger.addHandler(handler)
+        progress_logger.propagate = False
+        progress_logger.setLevel(level)
+
+
 def cli():
     parser = argparse.ArgumentParser(
         description="Contract Change Propagation Engine"
@@ -758,6 +883,7 @@ def cli():
         help="CI mode: use empty baseline if no snapshot exists (ensures first PR always diffs)",
     )
     args = parser.parse_args()
+    _configure_logging()
     asyncio.run(main(dry_run=args.dry_run, no_wait=args.no_wait, ci=args.ci))
 
 
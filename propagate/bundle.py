@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from propagate.classifier import ClassifiedChange
 from propagate.impact import ImpactRecord
@@ -34,7 +34,7 @@ class RepoFixBundle:
                 "routes": self.affected_routes,
                 "breaking_changes": self.breaking_changes,
             }, sort_keys=True)
-            self.bundle_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+            self.bundle_hash = hashlib.sha256(content.encode()).digest()[:8].hex()
 
 
 def _build_devin_prompt(
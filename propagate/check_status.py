@@ -10,14 +10,19 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import random
 import re
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, TypeVar
 
 import httpx
-from sqlalchemy import or_, select
+from sqlalchemy import func as sa_func, insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from propagate.devin_client import DevinClient
-from propagate.guardrails import load_guardrails
+from propagate.guardrails import Guardrails, load_guardrails
 from src.config import settings
 from src.database import async_session
 from src.entities.audit_log import AuditLog
@@ -25,29 +30,219 @@ from src.entities.remediation_job import RemediationJob, JobStatus
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 CI_UNKNOWN_MAX_ATTEMPTS = 5  # After this many polls with "unknown" CI, fail closed
-TERMINAL_STATUSES = {
+DEVIN_POLL_CONCURRENCY = 20  # max in-flight get_session calls per sync
+JOB_SYNC_CONCURRENCY = 20  # max jobs reconciled against GitHub at once per sync
+GITHUB_API_BASE = "https://api.github.com"
+GITHUB_MAX_RETRIES = 5  # retries of a rate-limited (403/429) GitHub request
+GITHUB_RETRY_BASE_DELAY = 1.0  # seconds; doubled per retry when GitHub gives no hint
+GITHUB_RATE_LIMIT_FLOOR = 10  # hold new requests once this few remain in the window
+GITHUB_RATE_LIMIT_MAX_WAIT = 60.0  # never stall a sync longer than this per request
+# Split budget: a stalled connect or pool wait fails fast instead of eating
+# the whole allowance while the other jobs in the fan-out wait on it.
+GITHUB_TIMEOUT = httpx.Timeout(connect=3.0, read=10.0, write=5.0, pool=5.0)
+GITHUB_ETAG_CACHE_SIZE = 512  # GitHub results kept for conditional requests
+_PR_URL_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+_REPO_URL_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$")
+TERMINAL_STATUSES = frozenset({
     JobStatus.MERGED.value,
     JobStatus.CI_FAILED.value,
     JobStatus.NEEDS_HUMAN.value,
+})
+# Last ETag and parsed result per GitHub API path. A 304 to If-None-Match is
+# free against the rate limit, so repeat polls of an unchanged PR cost no quota.
+_etag_cache: dict[str, tuple[str, Any]] = {}
+# sync_job_statuses summary key for each job status it reports on.
+_SUMMARY_BUCKETS = {
+    JobStatus.MERGED.value: "merged",
+    JobStatus.AWAITING_MERGE.value: "awaiting_merge",
+    JobStatus.CI_FAILED.value: "ci_failed",
+    JobStatus.NEEDS_HUMAN.value: "needs_human",
+    JobStatus.RUNNING.value: "running",
 }
 
 
 def _parse_pr_url(pr_url: str) -> tuple[str, str, str] | None:
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/pull/(\d+)", pr_url or "")
+    match = _PR_URL_RE.match(pr_url or "")
     if not match:
         return None
     return match.group(1), match.group(2), match.group(3)
 
 
 def _parse_repo_url(repo_url: str) -> tuple[str, str] | None:
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$", repo_url or "")
+    match = _REPO_URL_RE.match(repo_url or "")
     if not match:
         return None
     return match.group(1), match.group(2)
 
 
-async def _fetch_github_pr_metadata(pr_url: str) -> dict[str, str | bool]:
+class _GithubRateLimitTransport(httpx.AsyncBaseTransport):
+    """Paces GitHub requests using the rate-limit headers on every response.
+
+    Once ``X-RateLimit-Remaining`` drops to GITHUB_RATE_LIMIT_FLOOR, new
+    requests wait for ``X-RateLimit-Reset``. Rate-limited responses (429, or
+    403 with Retry-After or an exhausted quota) are retried after Retry-After,
+    the reset time, or exponential backoff with jitter. Waits longer than
+    GITHUB_RATE_LIMIT_MAX_WAIT are not taken; the response is returned as-is.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self._remaining: int | None = None
+        self._reset_at = 0.0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            await self._wait_for_quota()
+            response = await self._transport.handle_async_request(request)
+            self._record_quota(response.headers)
+            delay = self._retry_delay(response, attempt) if attempt < GITHUB_MAX_RETRIES else None
+            if delay is None:
+                return response
+            await response.aclose()
+            attempt += 1
+            logger.warning(
+                "GitHub rate limited (%d) on %s, retrying in %.1fs (attempt %d/%d)",
+                response.status_code, request.url.path, delay, attempt, GITHUB_MAX_RETRIES,
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    async def _wait_for_quota(self) -> None:
+        if self._remaining is None or self._remaining > GITHUB_RATE_LIMIT_FLOOR:
+            return
+        wait = self._reset_at - time.time()
+        if 0 < wait <= GITHUB_RATE_LIMIT_MAX_WAIT:
+            await asyncio.sleep(wait)
+            self._remaining = None
+
+    def _record_quota(self, headers: httpx.Headers) -> None:
+        try:
+            if "x-ratelimit-remaining" in headers:
+                self._remaining = int(headers["x-ratelimit-remaining"])
+            if "x-ratelimit-reset" in headers:
+                self._reset_at = float(headers["x-ratelimit-reset"])
+        except ValueError:
+            pass
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """Seconds to wait before retrying ``response``, or None to return it."""
+        retry_after = response.headers.get("retry-after")
+        exhausted = response.headers.get("x-ratelimit-remaining") == "0"
+        if response.status_code != 429 and not (
+            response.status_code == 403 and (retry_after or exhausted)
+        ):
+            return None
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        elif exhausted and self._reset_at:
+            delay = max(self._reset_at - time.time(), 0.0)
+        else:
+            delay = GITHUB_RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, GITHUB_RETRY_BASE_DELAY)
+        return delay if delay <= GITHUB_RATE_LIMIT_MAX_WAIT else None
+
+
+def _github_client() -> httpx.AsyncClient:
+    """Return a client for the GitHub REST API with auth headers preset.
+
+    One client per sync lets every PR/check/files request reuse the same
+    keep-alive connections instead of a fresh TLS handshake per call, and
+    share one view of the rate-limit quota. Concurrent requests are
+    multiplexed over a single HTTP/2 connection.
+    """
+    return httpx.AsyncClient(
+        base_url=GITHUB_API_BASE,
+        timeout=GITHUB_TIMEOUT,
+        headers={
+            "Authorization": f"Bearer {settings.github_token}",
+            "Accept": "application/vnd.github+json",
+        },
+        transport=_GithubRateLimitTransport(
+            httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=JOB_SYNC_CONCURRENCY,
+                    max_keepalive_connections=JOB_SYNC_CONCURRENCY,
+                ),
+            )
+        ),
+    )
+
+
+@asynccontextmanager
+async def _github_session(gh_client: httpx.AsyncClient | None) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield ``gh_client`` if given, else a short-lived client closed on exit."""
+    if gh_client is not None:
+        yield gh_client
+        return
+    async with _github_client() as client:
+        yield client
+
+
+async def _get_if_changed(
+    client: httpx.AsyncClient,
+    path: str,
+    parse: Callable[[Any], _T],
+) -> _T | None:
+    """GET ``path`` conditionally and return ``parse`` of the JSON body.
+
+    Sends the last ETag seen for ``path`` as If-None-Match; on 304 the
+    previously parsed result is returned without touching the body. Returns
+    None for any other non-200 response.
+    """
+    cached = _etag_cache.get(path)
+    resp = await client.get(path, headers={"If-None-Match": cached[0]} if cached else None)
+    if resp.status_code == 304 and cached:
+        return cached[1]
+    if resp.status_code != 200:
+        return None
+
+    result = parse(resp.json())
+    etag = resp.headers.get("ETag")
+    if etag:
+        _etag_cache.pop(path, None)
+        if len(_etag_cache) >= GITHUB_ETAG_CACHE_SIZE:
+            del _etag_cache[next(iter(_etag_cache))]
+        _etag_cache[path] = (etag, result)
+    return result
+
+
+def _parse_pr_metadata(payload: dict) -> dict[str, str | bool]:
+    return {
+        "state": str(payload.get("state") or "unknown"),
+        "merged": bool(payload.get("merged") or False),
+        "head_sha": str(payload.get("head", {}).get("sha") or ""),
+        "head_ref": str(payload.get("head", {}).get("ref") or ""),
+        "title": str(payload.get("title") or ""),
+        "author_login": str(payload.get("user", {}).get("login") or ""),
+    }
+
+
+def _parse_check_runs(payload: dict) -> tuple[bool, str]:
+    check_runs = payload.get("check_runs", [])
+    if not check_runs:
+        return False, "unknown"
+    if not all(cr.get("status") == "completed" for cr in check_runs):
+        return False, "pending"
+    if all(cr.get("conclusion") in ("success", "skipped") for cr in check_runs):
+        return True, "passed"
+    return False, "failed"
+
+
+def _parse_changed_files(payload: list) -> tuple[str, ...]:
+    return tuple(f.get("filename", "") for f in payload)
+
+
+async def _fetch_github_pr_metadata(
+    pr_url: str,
+    *,
+    gh_client: httpx.AsyncClient | None = None,
+) -> dict[str, str | bool]:
     """Fetch GitHub PR metadata needed to validate active PR attachment."""
     github_token = settings.github_token
     parsed = _parse_pr_url(pr_url)
@@ -57,26 +252,14 @@ async def _fetch_github_pr_metadata(pr_url: str) -> dict[str, str | bool]:
     owner, repo, pr_number = parsed
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            pr_resp = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
-                headers={
-                    "Authorization": f"Bearer {github_token}",
-                    "Accept": "application/vnd.github+json",
-                },
+        async with _github_session(gh_client) as client:
+            metadata = await _get_if_changed(
+                client, f"/repos/{owner}/{repo}/pulls/{pr_number}", _parse_pr_metadata
             )
-            if pr_resp.status_code != 200:
+            if metadata is None:
                 return {"state": "unknown", "merged": False, "head_sha": "", "head_ref": "", "title": "", "author_login": ""}
-
-            payload = pr_resp.json()
-            return {
-                "state": str(payload.get("state") or "unknown"),
-                "merged": bool(payload.get("merged") or False),
-                "head_sha": str(payload.get("head", {}).get("sha") or ""),
-                "head_ref": str(payload.get("head", {}).get("ref") or ""),
-                "title": str(payload.get("title") or ""),
-                "author_login": str(payload.get("user", {}).get("login") or ""),
-            }
+            # Copy so callers never mutate the cached entry.
+            return dict(metadata)
     except Exception as e:
         logger.warning("GitHub PR metadata fetch failed: %s", e)
         return {"state": "unknown", "merged": False, "head_sha": "", "head_ref": "", "title": "", "author_login": ""}
@@ -89,6 +272,7 @@ async def _find_replacement_open_pr(
     preferred_title: str = "",
     preferred_author_login: str = "",
     exclude_pr_url: str = "",
+    gh_client: httpx.AsyncClient | None = None,
 ) -> str | None:
     """Find an active open PR when a previously attached PR has gone stale."""
     github_token = settings.github_token
@@ -105,14 +289,10 @@ async def _find_replacement_open_pr(
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with _github_session(gh_client) as client:
             resp = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls",
+                f"/repos/{owner}/{repo}/pulls",
                 params={"state": "open", "per_page": 20},
-                headers={
-                    "Authorization": f"Bearer {github_token}",
-                    "Accept": "application/vnd.github+json",
-                },
             )
             if resp.status_code != 200:
                 return None
@@ -155,10 +335,16 @@ async def _find_replacement_open_pr(
     return None
 
 
-async def _fetch_github_ci_status(pr_url: str) -> tuple[bool, str]:
+async def _fetch_github_ci_status(
+    pr_url: str,
+    *,
+    gh_client: httpx.AsyncClient | None = None,
+    metadata: dict[str, str | bool] | None = None,
+) -> tuple[bool, str]:
     """Fetch CI status from GitHub Checks API as a fallback.
 
-    Returns (ci_passed, ci_status_string).
+    Pass ``metadata`` when the PR was already fetched this sync to skip a
+    second GET of the pull request. Returns (ci_passed, ci_status_string).
     """
     github_token = settings.github_token
     if not github_token or not pr_url:
@@ -171,7 +357,8 @@ async def _fetch_github_ci_status(pr_url: str) -> tuple[bool, str]:
     owner, repo, _pr_number = parsed
 
     try:
-        metadata = await _fetch_github_pr_metadata(pr_url)
+        if metadata is None:
+            metadata = await _fetch_github_pr_metadata(pr_url, gh_client=gh_client)
         if metadata["state"] == "closed" and not metadata["merged"]:
             return False, "closed"
         if metadata["merged"]:
@@ -181,36 +368,22 @@ async def _fetch_github_ci_status(pr_url: str) -> tuple[bool, str]:
         if not head_sha:
             return False, "unknown"
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with _github_session(gh_client) as client:
             # Get check runs for that SHA
-            checks_resp = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
-                headers={
-                    "Authorization": f"Bearer {github_token}",
-                    "Accept": "application/vnd.github+json",
-                },
+            ci_result = await _get_if_changed(
+                client, f"/repos/{owner}/{repo}/commits/{head_sha}/check-runs", _parse_check_runs
             )
-            if checks_resp.status_code != 200:
-                return False, "unknown"
-
-            check_runs = checks_resp.json().get("check_runs", [])
-            if not check_runs:
-                return False, "unknown"
-
-            all_complete = all(cr.get("status") == "completed" for cr in check_runs)
-            all_passed = all(cr.get("conclusion") in ("success", "skipped") for cr in check_runs)
-
-            if not all_complete:
-                return False, "pending"
-            if all_passed:
-                return True, "passed"
-            return False, "failed"
+            return ci_result or (False, "unknown")
     except Exception as e:
         logger.warning("GitHub Checks API fetch failed: %s", e)
         return False, "unknown"
 
 
-async def _fetch_pr_changed_files(pr_url: str) -> list[str]:
+async def _fetch_pr_changed_files(
+    pr_url: str,
+    *,
+    gh_client: httpx.AsyncClient | None = None,
+) -> list[str]:
     """Fetch the list of changed files from a GitHub PR.
 
     Returns a list of file paths, or empty list on failure.
@@ -226,36 +399,279 @@ async def _fetch_pr_changed_files(pr_url: str) -> list[str]:
     owner, repo, pr_number = parsed
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/files",
-                headers={
-                    "Authorization": f"Bearer {github_token}",
-                    "Accept": "application/vnd.github+json",
-                },
+        async with _github_session(gh_client) as client:
+            files = await _get_if_changed(
+                client, f"/repos/{owner}/{repo}/pulls/{pr_number}/files", _parse_changed_files
             )
-            if resp.status_code != 200:
-                return []
-            return [f.get("filename", "") for f in resp.json()]
+            return list(files or ())
     except Exception as e:
         logger.warning("GitHub PR files fetch failed: %s", e)
         return []
 
 
-async def _log_transition(
-    db: AsyncSession,
+def _log_transition(
+    audit_rows: list[dict],
     job: RemediationJob,
     old_status: str,
     new_status: str,
     detail: str | None = None,
 ):
-    entry = AuditLog(
-        job_id=job.job_id,
-        old_status=old_status,
-        new_status=new_status,
-        detail=detail,
-    )
-    db.add(entry)
+    """Queue an audit_log row; sync_job_statuses inserts them all in one batch."""
+    audit_rows.append({
+        "job_id": job.job_id,
+        "old_status": old_status,
+        "new_status": new_status,
+        "detail": detail,
+    })
+
+
+async def _sync_job(
+    job: RemediationJob,
+    status: dict,
+    guardrails: Guardrails,
+    *,
+    devin_enabled: bool,
+    ci_unknown_count: int,
+    gh_client: httpx.AsyncClient | None = None,
+) -> tuple[bool, list[str], list[dict]]:
+    """Reconcile one non-terminal job with its Devin status and GitHub PR state.
+
+    Updates ``job`` in place and returns ``(dirty, progress_lines, audit_rows)``.
+    Audit rows and progress lines are handed back rather than written, so
+    sync_job_statuses can run many jobs concurrently and still apply the
+    results in job order.
+    """
+    messages: list[str] = []
+    audit_rows: list[dict] = []
+
+    devin_status = status.get("status_enum", "")
+    structured_output = status.get("structured_output", {})
+    if not isinstance(structured_output, dict):
+        structured_output = {}
+
+    dirty = False
+    candidate_pr_url = ""
+    candidate_pr_metadata: dict[str, str | bool] = {
+        "state": "unknown",
+        "merged": False,
+        "head_sha": "",
+    }
+    if structured_output:
+        pr_info = structured_output.get("pull_request")
+        if isinstance(pr_info, dict):
+            candidate_pr_url = pr_info.get("url", "")
+            candidate_pr_metadata = await _fetch_github_pr_metadata(candidate_pr_url, gh_client=gh_client)
+            attach_pr = bool(candidate_pr_url) and not (
+                candidate_pr_metadata["state"] == "closed" and not candidate_pr_metadata["merged"]
+            )
+            next_pr_url = candidate_pr_url if attach_pr else None
+            if job.pr_url != next_pr_url:
+                job.pr_url = next_pr_url
+                dirty = True
+
+        if (
+            job.pr_url
+            and job.status not in {JobStatus.AWAITING_MERGE.value, JobStatus.MERGED.value}
+            and devin_status not in {"stopped", "blocked"}
+        ):
+            old = job.status
+            job.status = JobStatus.AWAITING_MERGE.value
+            job.error_summary = None
+            _log_transition(audit_rows, job, old, JobStatus.AWAITING_MERGE.value, f"PR: {job.pr_url}")
+            messages.append(f"  [{job.target_repo}] -> AWAITING_MERGE: {job.pr_url}")
+            dirty = True
+
+    if devin_status in ("blocked", "stopped") or (not devin_status and not devin_enabled):
+        pr_state_url = candidate_pr_url or job.pr_url or ""
+        pr_state_metadata = (
+            candidate_pr_metadata
+            if candidate_pr_url
+            else await _fetch_github_pr_metadata(pr_state_url, gh_client=gh_client)
+            if pr_state_url
+            else {"state": "unknown", "merged": False, "head_sha": ""}
+        )
+        if pr_state_url and pr_state_metadata["state"] == "closed" and not pr_state_metadata["merged"]:
+            replacement_pr_url = await _find_replacement_open_pr(
+                pr_state_url,
+                preferred_head_ref=str(pr_state_metadata.get("head_ref") or ""),
+                preferred_title=str(pr_state_metadata.get("title") or ""),
+                preferred_author_login=str(pr_state_metadata.get("author_login") or ""),
+                exclude_pr_url=pr_state_url,
+                gh_client=gh_client,
+            )
+            if replacement_pr_url:
+                if job.pr_url != replacement_pr_url:
+                    job.pr_url = replacement_pr_url
+                    dirty = True
+                pr_state_url = replacement_pr_url
+                pr_state_metadata = await _fetch_github_pr_metadata(pr_state_url, gh_client=gh_client)
+
+        if pr_state_url and pr_state_metadata["state"] == "closed" and not pr_state_metadata["merged"]:
+            error_summary = "PR closed without merge"
+            if (
+                job.status != JobStatus.NEEDS_HUMAN.value
+                or job.error_summary != error_summary
+                or job.pr_url is not None
+            ):
+                old = job.status
+                job.status = JobStatus.NEEDS_HUMAN.value
+                job.error_summary = error_summary
+                job.pr_url = None
+                _log_transition(
+                    audit_rows,
+                    job,
+                    old,
+                    JobStatus.NEEDS_HUMAN.value,
+                    f"PR closed without merge: {pr_state_url}",
+                )
+                messages.append(f"  [{job.target_repo}] -> NEEDS_HUMAN (closed PR): {pr_state_url}")
+                dirty = True
+            return dirty, messages, audit_rows
+
+        if job.pr_url:
+            ci_passed, ci_status = await _fetch_github_ci_status(
+                job.pr_url,
+                gh_client=gh_client,
+                # Reuse the PR fetched above instead of requesting it again.
+                metadata=pr_state_metadata if pr_state_url == job.pr_url else None,
+            )
+
+            if ci_status == "unknown":
+                ci_status = structured_output.get("ci_status", "unknown")
+                ci_passed = ci_status in ("passed", "success")
+
+            if guardrails.ci_required and not ci_passed:
+                if ci_status == "unknown":
+                    if ci_unknown_count >= CI_UNKNOWN_MAX_ATTEMPTS:
+                        error_summary = (
+                            f"CI status unknown after {CI_UNKNOWN_MAX_ATTEMPTS} checks — failing closed"
+                        )
+                        if job.status != JobStatus.CI_FAILED.value or job.error_summary != error_summary:
+                            old = job.status
+                            job.status = JobStatus.CI_FAILED.value
+                            job.error_summary = error_summary
+                            _log_transition(
+                                audit_rows,
+                                job,
+                                old,
+                                JobStatus.CI_FAILED.value,
+                                f"CI status unknown after {CI_UNKNOWN_MAX_ATTEMPTS} checks — failing closed: {job.pr_url}",
+                            )
+                            messages.append(
+                                f"  [{job.target_repo}] -> CI_FAILED (unknown after {CI_UNKNOWN_MAX_ATTEMPTS} checks): {job.pr_url}"
+                            )
+                            dirty = True
+                    else:
+                        detail = (
+                            f"CI status unknown, holding at AWAITING_MERGE (attempt {ci_unknown_count + 1}/{CI_UNKNOWN_MAX_ATTEMPTS}): {job.pr_url}"
+                        )
+                        if job.status != JobStatus.AWAITING_MERGE.value:
+                            old = job.status
+                            job.status = JobStatus.AWAITING_MERGE.value
+                            job.error_summary = None
+                            _log_transition(
+                                audit_rows,
+                                job,
+                                old,
+                                JobStatus.AWAITING_MERGE.value,
+                                detail,
+                            )
+                            messages.append(
+                                f"  [{job.target_repo}] -> AWAITING_MERGE (CI unknown, attempt {ci_unknown_count + 1}/{CI_UNKNOWN_MAX_ATTEMPTS}): {job.pr_url}"
+                            )
+                            dirty = True
+                else:
+                    error_summary = f"CI status: {ci_status}"
+                    if job.status != JobStatus.CI_FAILED.value or job.error_summary != error_summary:
+                        old = job.status
+                        job.status = JobStatus.CI_FAILED.value
+                        job.error_summary = error_summary
+                        _log_transition(
+                            audit_rows,
+                            job,
+                            old,
+                            JobStatus.CI_FAILED.value,
+                            f"PR exists but CI failed ({ci_status}): {job.pr_url}",
+                        )
+                        messages.append(f"  [{job.target_repo}] -> CI_FAILED ({ci_status}): {job.pr_url}")
+                        dirty = True
+            else:
+                pr_changed_files = structured_output.get("changed_files", [])
+                # Changed files only matter for the protected-path check.
+                if not pr_changed_files and job.pr_url and guardrails.protected_paths:
+                    pr_changed_files = await _fetch_pr_changed_files(job.pr_url, gh_client=gh_client)
+                if pr_changed_files:
+                    path_violations = guardrails.validate_paths(pr_changed_files)
+                    if path_violations:
+                        error_summary = f"PR touches protected paths: {'; '.join(path_violations)}"
+                        if job.status != JobStatus.NEEDS_HUMAN.value or job.error_summary != error_summary:
+                            old = job.status
+                            job.status = JobStatus.NEEDS_HUMAN.value
+                            job.error_summary = error_summary
+                            _log_transition(
+                                audit_rows,
+                                job,
+                                old,
+                                JobStatus.NEEDS_HUMAN.value,
+                                f"Post-execution path violation: {'; '.join(path_violations)}",
+                            )
+                            messages.append(f"  [{job.target_repo}] -> NEEDS_HUMAN (protected path): {path_violations}")
+                            dirty = True
+                        return dirty, messages, audit_rows
+                elif guardrails.protected_paths:
+                    error_summary = "Cannot verify PR changed files against protected paths"
+                    if job.status != JobStatus.NEEDS_HUMAN.value or job.error_summary != error_summary:
+                        old = job.status
+                        job.status = JobStatus.NEEDS_HUMAN.value
+                        job.error_summary = error_summary
+                        _log_transition(
+                            audit_rows,
+                            job,
+                            old,
+                            JobStatus.NEEDS_HUMAN.value,
+                            "Path validation fail-closed: changed files unavailable",
+                        )
+                        messages.append(f"  [{job.target_repo}] -> NEEDS_HUMAN (changed files unavailable for path check)")
+                        dirty = True
+                    return dirty, messages, audit_rows
+
+                _merge_ok, merge_reason = guardrails.check_can_merge(ci_passed)
+                detail = f"PR: {job.pr_url} | merge: {merge_reason}"
+                if job.status != JobStatus.MERGED.value or job.error_summary is not None:
+                    old = job.status
+                    job.status = JobStatus.MERGED.value
+                    job.error_summary = None
+                    _log_transition(audit_rows, job, old, JobStatus.MERGED.value, detail)
+                    messages.append(f"  [{job.target_repo}] -> MERGED: {job.pr_url} ({merge_reason})")
+                    dirty = True
+        else:
+            # No PR on the job — try to discover one in the repo.
+            replacement_pr_url = (
+                await _find_replacement_open_pr(job.target_repo, gh_client=gh_client)
+                if job.target_repo
+                else None
+            )
+            if replacement_pr_url:
+                old = job.status
+                job.pr_url = replacement_pr_url
+                job.status = JobStatus.AWAITING_MERGE.value
+                job.error_summary = None
+                _log_transition(audit_rows, job, old, JobStatus.AWAITING_MERGE.value, f"Found PR: {replacement_pr_url}")
+                messages.append(f"  [{job.target_repo}] -> AWAITING_MERGE (found replacement): {replacement_pr_url}")
+                dirty = True
+            else:
+                no_pr_msg = f"Devin {devin_status} without PR"
+                if job.status != JobStatus.NEEDS_HUMAN.value or job.error_summary != no_pr_msg:
+                    old = job.status
+                    job.status = JobStatus.NEEDS_HUMAN.value
+                    job.error_summary = no_pr_msg
+                    _log_transition(audit_rows, job, old, JobStatus.NEEDS_HUMAN.value, job.error_summary)
+                    messages.append(f"  [{job.target_repo}] -> NEEDS_HUMAN (no PR)")
+                    dirty = True
+    else:
+        messages.append(f"  [{job.target_repo}] still {job.status} (devin: {devin_status or 'unknown'})")
+
+    return dirty, messages, audit_rows
 
 
 async def sync_job_statuses(
@@ -263,13 +679,24 @@ async def sync_job_statuses(
     change_id: int | None = None,
     *,
     log_progress: bool = False,
+    lock_rows: bool = False,
 ) -> dict[str, int]:
-    """Sync remediation jobs against live Devin/GitHub state."""
+    """Sync remediation jobs against live Devin/GitHub state.
+
+    With ``lock_rows`` the non-terminal jobs are selected FOR UPDATE SKIP
+    LOCKED (Postgres; a no-op on SQLite) so two pollers never reconcile the
+    same job. The locks are held until the commit at the end, across every
+    Devin/GitHub call, so only pass it with a session dedicated to this sync
+    (the CLI poller), never a request or sync_devin session. Jobs locked by
+    another sync are left out of ``checked`` and the status buckets and
+    counted in ``skipped`` instead.
+    """
     try:
         client = DevinClient()
     except ValueError:
         client = None
         logger.warning("Devin API key not configured — skipping Devin polling, GitHub-only mode")
+    gh_client = _github_client() if settings.github_token else None
     guardrails = load_guardrails()
     summary = {
         "checked": 0,
@@ -279,303 +706,171 @@ async def sync_job_statuses(
         "ci_failed": 0,
         "needs_human": 0,
         "running": 0,
+        "skipped": 0,
     }
 
     def emit(message: str) -> None:
         if log_progress:
-            print(message)
+            logger.info(message)
 
     try:
-        stmt = select(RemediationJob).where(
+        filters = [
             or_(
                 RemediationJob.devin_run_id.isnot(None),
                 RemediationJob.pr_url.isnot(None),
             )
-        )
+        ]
         if change_id is not None:
-            stmt = stmt.where(RemediationJob.change_id == change_id)
-
-        result = await db.execute(stmt.order_by(RemediationJob.updated_at.desc(), RemediationJob.created_at.desc()))
+            filters.append(RemediationJob.change_id == change_id)
+
+        # Jobs in a terminal state are never re-evaluated: without that guard,
+        # failed external API calls (Devin/GitHub) could downgrade a verified
+        # merged job back to awaiting_merge or ci_failed. They are only counted,
+        # in SQL, rather than loaded.
+        terminal_result = await db.execute(
+            select(RemediationJob.status, sa_func.count(RemediationJob.job_id))
+            .where(*filters, RemediationJob.status.in_(TERMINAL_STATUSES))
+            .group_by(RemediationJob.status)
+        )
+        for job_status, count in terminal_result.tuples():
+            summary["checked"] += count
+            summary[_SUMMARY_BUCKETS[job_status]] += count
+
+        jobs_query = (
+            select(RemediationJob)
+            .where(*filters, RemediationJob.status.notin_(TERMINAL_STATUSES))
+            .order_by(RemediationJob.updated_at.desc(), RemediationJob.created_at.desc())
+        )
+        if lock_rows:
+            jobs_query = jobs_query.with_for_update(skip_locked=True)
+        result = await db.execute(jobs_query)
         jobs = list(result.scalars().all())
 
+        if lock_rows:
+            # Rows another sync holds were skipped by the locking select; a
+            # plain count does not wait on their locks.
+            skipped_result = await db.execute(
+                select(sa_func.count(RemediationJob.job_id)).where(
+                    *filters,
+                    RemediationJob.status.notin_(TERMINAL_STATUSES),
+                    RemediationJob.job_id.notin_([job.job_id for job in jobs]),
+                )
+            )
+            summary["skipped"] = skipped_result.scalar_one()
+            if summary["skipped"]:
+                emit(f"Skipping {summary['skipped']} job(s) locked by another sync.")
+
         if not jobs:
             emit("No remediation jobs to sync.")
             return summary
 
         emit(f"Checking {len(jobs)} remediation jobs...\n")
+        audit_rows: list[dict] = []
 
-        for job in jobs:
-            summary["checked"] += 1
+        # Poll every live Devin session concurrently up front; the loop below
+        # still applies the results one job at a time, in order.
+        session_results: dict[int, dict | BaseException] = {}
+        if client is not None:
+            poll_jobs = [job for job in jobs if job.devin_run_id]
+            semaphore = asyncio.Semaphore(DEVIN_POLL_CONCURRENCY)
+
+            async def poll(session_id: str) -> dict:
+                async with semaphore:
+                    return await client.get_session(session_id)
 
-            # Don't re-evaluate jobs that have already reached a terminal state.
-            # Without this guard, failed external API calls (Devin/GitHub) can
-            # downgrade a verified merged job back to awaiting_merge or ci_failed.
-            if job.status in TERMINAL_STATUSES:
-                continue
+            results = await asyncio.gather(
+                *(poll(job.devin_run_id) for job in poll_jobs),
+                return_exceptions=True,
+            )
+            session_results = {job.job_id: res for job, res in zip(poll_jobs, results)}
 
+        # Resolve the Devin results in job order; an auth failure stops the
+        # sync at that job, and jobs before it are still reconciled.
+        to_sync: list[tuple[RemediationJob, dict, list[str]]] = []
+        auth_failed = False
+        for job in jobs:
+            summary["checked"] += 1
             status = {}
+            poll_messages: list[str] = []
             if job.devin_run_id and client is not None:
-                try:
-                    status = await client.get_session(job.devin_run_id)
-                except Exception as e:
-                    if "Authentication failed" in str(e):
-                        emit(f"  Devin API auth failed — skipping remaining polls")
+                polled = session_results[job.job_id]
+                if isinstance(polled, Exception):
+                    if "Authentication failed" in str(polled):
+                        auth_failed = True
                         break
-                    logger.warning("Failed to poll %s: %s", job.devin_run_id, e)
-                    emit(f"  [{job.target_repo}] poll error: {e}")
-
-            devin_status = status.get("status_enum", "")
-            structured_output = status.get("structured_output", {})
-            if not isinstance(structured_output, dict):
-                structured_output = {}
-
-            dirty = False
-            candidate_pr_url = ""
-            candidate_pr_metadata: dict[str, str | bool] = {
-                "state": "unknown",
-                "merged": False,
-                "head_sha": "",
-            }
-            if structured_output:
-                pr_info = structured_output.get("pull_request")
-                if isinstance(pr_info, dict):
-                    candidate_pr_url = pr_info.get("url", "")
-                    candidate_pr_metadata = await _fetch_github_pr_metadata(candidate_pr_url)
-                    attach_pr = bool(candidate_pr_url) and not (
-                        candidate_pr_metadata["state"] == "closed" and not candidate_pr_metadata["merged"]
-                    )
-                    next_pr_url = candidate_pr_url if attach_pr else None
-                    if job.pr_url != next_pr_url:
-                        job.pr_url = next_pr_url
-                        dirty = True
-
-                if (
-                    job.pr_url
-                    and job.status not in {JobStatus.AWAITING_MERGE.value, JobStatus.MERGED.value}
-                    and devin_status not in {"stopped", "blocked"}
-                ):
-                    old = job.status
-                    job.status = JobStatus.AWAITING_MERGE.value
-                    job.error_summary = None
-                    await _log_transition(db, job, old, JobStatus.AWAITING_MERGE.value, f"PR: {job.pr_url}")
-                    emit(f"  [{job.target_repo}] -> AWAITING_MERGE: {job.pr_url}")
-                    dirty = True
-
-            if devin_status in ("blocked", "stopped") or (not devin_status and client is None):
-                pr_state_url = candidate_pr_url or job.pr_url or ""
-                pr_state_metadata = (
-                    candidate_pr_metadata
-                    if candidate_pr_url
-                    else await _fetch_github_pr_metadata(pr_state_url)
-                    if pr_state_url
-                    else {"state": "unknown", "merged": False, "head_sha": ""}
-                )
-                if pr_state_url and pr_state_metadata["state"] == "closed" and not pr_state_metadata["merged"]:
-                    replacement_pr_url = await _find_replacement_open_pr(
-                        pr_state_url,
-                        preferred_head_ref=str(pr_state_metadata.get("head_ref") or ""),
-                        preferred_title=str(pr_state_metadata.get("title") or ""),
-                        preferred_author_login=str(pr_state_metadata.get("author_login") or ""),
-                        exclude_pr_url=pr_state_url,
-                    )
-                    if replacement_pr_url:
-                        if job.pr_url != replacement_pr_url:
-                            job.pr_url = replacement_pr_url
-                            dirty = True
-                        pr_state_url = replacement_pr_url
-                        pr_state_metadata = await _fetch_github_pr_metadata(pr_state_url)
-
-                if pr_state_url and pr_state_metadata["state"] == "closed" and not pr_state_metadata["merged"]:
-                    error_summary = "PR closed without merge"
-                    if (
-                        job.status != JobStatus.NEEDS_HUMAN.value
-                        or job.error_summary != error_summary
-                        or job.pr_url is not None
-                    ):
-                        old = job.status
-                        job.status = JobStatus.NEEDS_HUMAN.value
-                        job.error_summary = error_summary
-                        job.pr_url = None
-                        await _log_transition(
-                            db,
-                            job,
-                            old,
-                            JobStatus.NEEDS_HUMAN.value,
-                            f"PR closed without merge: {pr_state_url}",
-                        )
-                        emit(f"  [{job.target_repo}] -> NEEDS_HUMAN (closed PR): {pr_state_url}")
-                        dirty = True
-                    if dirty:
-                        summary["updated"] += 1
-                    continue
-
-                if job.pr_url:
-                    ci_passed, ci_status = await _fetch_github_ci_status(job.pr_url)
-
-                    if ci_status == "unknown":
-                        ci_status = (structured_output or {}).get("ci_status", "unknown")
-                        ci_passed = ci_status in ("passed", "success")
-
-                    if guardrails.ci_required and not ci_passed:
-                        if ci_status == "unknown":
-                            from sqlalchemy import func as sa_func
-                            ci_unknown_count_result = await db.execute(
-                                select(sa_func.count(AuditLog.id)).where(
-                                    AuditLog.job_id == job.job_id,
-                                    AuditLog.detail.contains("CI status unknown"),
-                                )
-                            )
-                            ci_unknown_count = ci_unknown_count_result.scalar() or 0
-
-                            if ci_unknown_count >= CI_UNKNOWN_MAX_ATTEMPTS:
-                                error_summary = (
-                                    f"CI status unknown after {CI_UNKNOWN_MAX_ATTEMPTS} checks — failing closed"
-                                )
-                                if job.status != JobStatus.CI_FAILED.value or job.error_summary != error_summary:
-                                    old = job.status
-                                    job.status = JobStatus.CI_FAILED.value
-                                    job.error_summary = error_summary
-                                    await _log_transition(
-                                        db,
-                                        job,
-                                        old,
-                                        JobStatus.CI_FAILED.value,
-                                        f"CI status unknown after {CI_UNKNOWN_MAX_ATTEMPTS} checks — failing closed: {job.pr_url}",
-                                    )
-                                    emit(
-                                        f"  [{job.target_repo}] -> CI_FAILED (unknown after {CI_UNKNOWN_MAX_ATTEMPTS} checks): {job.pr_url}"
-                                    )
-                                    dirty = True
-                            else:
-                                detail = (
-                                    f"CI status unknown, holding at AWAITING_MERGE (attempt {ci_unknown_count + 1}/{CI_UNKNOWN_MAX_ATTEMPTS}): {job.pr_url}"
-                                )
-                                if job.status != JobStatus.AWAITING_MERGE.value:
-                                    old = job.status
-                                    job.status = JobStatus.AWAITING_MERGE.value
-                                    job.error_summary = None
-                                    await _log_transition(
-                                        db,
-                                        job,
-                                        old,
-                                        JobStatus.AWAITING_MERGE.value,
-                                        detail,
-                                    )
-                                    emit(
-                                        f"  [{job.target_repo}] -> AWAITING_MERGE (CI unknown, attempt {ci_unknown_count + 1}/{CI_UNKNOWN_MAX_ATTEMPTS}): {job.pr_url}"
-                                    )
-                                    dirty = True
-                        else:
-                            error_summary = f"CI status: {ci_status}"
-                            if job.status != JobStatus.CI_FAILED.value or job.error_summary != error_summary:
-                                old = job.status
-                                job.status = JobStatus.CI_FAILED.value
-                                job.error_summary = error_summary
-                                await _log_transition(
-                                    db,
-                                    job,
-                                    old,
-                                    JobStatus.CI_FAILED.value,
-                                    f"PR exists but CI failed ({ci_status}): {job.pr_url}",
-                                )
-                                emit(f"  [{job.target_repo}] -> CI_FAILED ({ci_status}): {job.pr_url}")
-                                dirty = True
-                    else:
-                        pr_changed_files = (structured_output or {}).get("changed_files", [])
-                        if not pr_changed_files and job.pr_url:
-                            pr_changed_files = await _fetch_pr_changed_files(job.pr_url)
-                        if pr_changed_files:
-                            path_violations = guardrails.validate_paths(pr_changed_files)
-                            if path_violations:
-                                error_summary = f"PR touches protected paths: {'; '.join(path_violations)}"
-                                if job.status != JobStatus.NEEDS_HUMAN.value or job.error_summary != error_summary:
-                                    old = job.status
-                                    job.status = JobStatus.NEEDS_HUMAN.value
-                                    job.error_summary = error_summary
-                                    await _log_transition(
-                                        db,
-                                        job,
-                                        old,
-                                        JobStatus.NEEDS_HUMAN.value,
-                                        f"Post-execution path violation: {'; '.join(path_violations)}",
-                                    )
-                                    emit(f"  [{job.target_repo}] -> NEEDS_HUMAN (protected path): {path_violations}")
-                                    dirty = True
-                                continue
-                        elif guardrails.protected_paths:
-                            error_summary = "Cannot verify PR changed files against protected paths"
-                            if job.status != JobStatus.NEEDS_HUMAN.value or job.error_summary != error_summary:
-                                old = job.status
-                                job.status = JobStatus.NEEDS_HUMAN.value
-                                job.error_summary = error_summary
-                                await _log_transition(
-                                    db,
-                                    job,
-                                    old,
-                                    JobStatus.NEEDS_HUMAN.value,
-                                    "Path validation fail-closed: changed files unavailable",
-                                )
-                                emit(f"  [{job.target_repo}] -> NEEDS_HUMAN (changed files unavailable for path check)")
-                                dirty = True
-                            continue
-
-                        _merge_ok, merge_reason = guardrails.check_can_merge(ci_passed)
-                        detail = f"PR: {job.pr_url} | merge: {merge_reason}"
-                        if job.status != JobStatus.MERGED.value or job.error_summary is not None:
-                            old = job.status
-                            job.status = JobStatus.MERGED.value
-                            job.error_summary = None
-                            await _log_transition(db, job, old, JobStatus.MERGED.value, detail)
-                            emit(f"  [{job.target_repo}] -> MERGED: {job.pr_url} ({merge_reason})")
-                            dirty = True
+                    logger.warning("Failed to poll %s: %s", job.devin_run_id, polled)
+                    poll_messages.append(f"  [{job.target_repo}] poll error: {polled}")
+                elif isinstance(polled, BaseException):
+                    raise polled
                 else:
-                    # No PR on the job — try to discover one in the repo.
-                    replacement_pr_url = await _find_replacement_open_pr(job.target_repo or "") if job.target_repo else None
-                    if replacement_pr_url:
-                        old = job.status
-                        job.pr_url = replacement_pr_url
-                        job.status = JobStatus.AWAITING_MERGE.value
-                        job.error_summary = None
-                        await _log_transition(db, job, old, JobStatus.AWAITING_MERGE.value, f"Found PR: {replacement_pr_url}")
-                        emit(f"  [{job.target_repo}] -> AWAITING_MERGE (found replacement): {replacement_pr_url}")
-                        dirty = True
-                    else:
-                        no_pr_msg = f"Devin {devin_status} without PR"
-                        if job.status != JobStatus.NEEDS_HUMAN.value or job.error_summary != no_pr_msg:
-                            old = job.status
-                            job.status = JobStatus.NEEDS_HUMAN.value
-                            job.error_summary = no_pr_msg
-                            await _log_transition(db, job, old, JobStatus.NEEDS_HUMAN.value, job.error_summary)
-                            emit(f"  [{job.target_repo}] -> NEEDS_HUMAN (no PR)")
-                            dirty = True
-            else:
-                emit(f"  [{job.target_repo}] still {job.status} (devin: {devin_status or 'unknown'})")
+                    status = polled
+            to_sync.append((job, status, poll_messages))
+
+        # Prior "CI status unknown" holds per job, counted in one grouped query
+        # so the concurrent job syncs below never touch the session.
+        ci_unknown_counts: dict[int, int] = {}
+        if to_sync:
+            counts_result = await db.execute(
+                select(AuditLog.job_id, sa_func.count(AuditLog.id))
+                .where(
+                    AuditLog.job_id.in_([job.job_id for job, _, _ in to_sync]),
+                    AuditLog.detail.contains("CI status unknown"),
+                )
+                .group_by(AuditLog.job_id)
+            )
+            ci_unknown_counts = dict(counts_result.tuples().all())
+
+        job_semaphore = asyncio.Semaphore(JOB_SYNC_CONCURRENCY)
+
+        async def sync_one(job: RemediationJob, status: dict) -> tuple[bool, list[str], list[dict]]:
+            async with job_semaphore:
+                return await _sync_job(
+                    job,
+                    status,
+                    guardrails,
+                    devin_enabled=client is not None,
+                    ci_unknown_count=ci_unknown_counts.get(job.job_id, 0),
+                    gh_client=gh_client,
+                )
 
+        synced = await asyncio.gather(*(sync_one(job, status) for job, status, _ in to_sync))
+        for (_job, _status, poll_messages), (dirty, messages, job_audit_rows) in zip(to_sync, synced):
+            for message in poll_messages + messages:
+                emit(message)
+            audit_rows.extend(job_audit_rows)
             if dirty:
                 summary["updated"] += 1
+        if auth_failed:
+            emit("  Devin API auth failed — skipping remaining polls")
 
+        # Job UPDATEs are batched by the unit of work at commit; audit rows go
+        # in as one executemany.
+        if audit_rows:
+            await db.execute(insert(AuditLog), audit_rows)
         await db.commit()
-        status_counts = {
-            JobStatus.MERGED.value: "merged",
-            JobStatus.AWAITING_MERGE.value: "awaiting_merge",
-            JobStatus.CI_FAILED.value: "ci_failed",
-            JobStatus.NEEDS_HUMAN.value: "needs_human",
-            JobStatus.RUNNING.value: "running",
-        }
         for job in jobs:
-            bucket = status_counts.get(job.status)
+            bucket = _SUMMARY_BUCKETS.get(job.status)
             if bucket:
                 summary[bucket] += 1
         return summary
     finally:
         if client is not None:
             await client.close()
+        if gh_client is not None:
+            await gh_client.aclose()
 
 
 async def check_jobs(change_id: int | None = None) -> None:
     """Check Devin status for jobs, optionally filtered by change_id."""
-    async with async_session() as db:
-        summary = await sync_job_statuses(db=db, change_id=change_id, log_progress=True)
+    # A dedicated session and transaction, so the row locks taken by
+    # lock_rows are released on commit or rollback when the block exits.
+    async with async_session() as db, db.begin():
+        summary = await sync_job_statuses(
+            db=db,
+            change_id=change_id,
+            log_progress=True,
+            lock_rows=True,
+        )
     print(f"\nDone. Checked {summary['checked']} jobs, updated {summary['updated']}.")
 
 
@@ -584,7 +879,7 @@ def main() -> None:
     parser.add_argument("--change-id", type=int, default=None, help="Filter by change_id")
     args = parser.parse_args()
 
-    logging.basicConfig(level=logging.INFO)
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(check_jobs(change_id=args.change_id))
 
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 
 from propagate.differ import ContractDiff
@@ -27,6 +26,27 @@ BREAKING_DIFF_TYPES = {
     "security_changed",
 }
 
+# Diff types that feed each summary category, and the category labels in the
+# order they appear in the summary.
+_SUMMARY_CATEGORY = {
+    "field_added_required": "required",
+    "field_optional_to_required": "required",
+    "field_removed": "removed",
+    "nested_field_removed": "removed",
+    "response_structure_changed": "structure",
+    "field_type_changed": "type",
+    "nested_field_type_changed": "type",
+    "array_item_type_changed": "type",
+    "enum_values_removed": "enum",
+}
+_SUMMARY_LABELS = (
+    ("required", "New required field(s)"),
+    ("removed", "Removed field(s)"),
+    ("structure", "Response structure changed"),
+    ("type", "Type changed"),
+    ("enum", "Enum values removed"),
+)
+
 
 @dataclass
 class ClassifiedChange:
@@ -50,67 +70,48 @@ def classify_changes(diffs: list[ContractDiff]) -> ClassifiedChange:
             diffs=[],
         )
 
-    breaking_diffs = [d for d in diffs if d.diff_type in BREAKING_DIFF_TYPES]
-    is_breaking = len(breaking_diffs) > 0
+    # Single pass: bucket fields by summary category (keeping diff order within
+    # each bucket) and collect routes and changed fields along the way.
+    is_breaking = False
+    category_fields: dict[str, list[str]] = {}
+    changed_routes_set: set[str] = set()
+    changed_fields = []
+    for d in diffs:
+        if d.diff_type in BREAKING_DIFF_TYPES:
+            is_breaking = True
+        category = _SUMMARY_CATEGORY.get(d.diff_type)
+        if category is not None:
+            category_fields.setdefault(category, []).append(d.field)
+        changed_routes_set.add(f"{d.method.upper()} {d.path}")
+        changed_fields.append({
+            "path": d.path,
+            "method": d.method,
+            "field": d.field,
+            "diff_type": d.diff_type,
+            "old_value": str(d.old_value) if d.old_value is not None else None,
+            "new_value": str(d.new_value) if d.new_value is not None else None,
+        })
 
     # Determine severity
-    has_required_field_add = any(
-        d.diff_type in ("field_added_required", "field_optional_to_required") for d in diffs
-    )
-    has_structure_change = any(d.diff_type == "response_structure_changed" for d in diffs)
-    has_field_removed = any(
-        d.diff_type in ("field_removed", "nested_field_removed") for d in diffs
-    )
-    has_type_change = any(
-        d.diff_type in ("field_type_changed", "nested_field_type_changed", "array_item_type_changed")
-        for d in diffs
-    )
-    has_enum_narrowing = any(d.diff_type == "enum_values_removed" for d in diffs)
-
-    if has_required_field_add or has_structure_change:
+    if "required" in category_fields or "structure" in category_fields:
         severity = "critical"
-    elif has_field_removed or has_enum_narrowing:
+    elif "removed" in category_fields or "enum" in category_fields:
         severity = "high"
-    elif has_type_change:
+    elif "type" in category_fields:
         severity = "medium"
     else:
         severity = "low"
 
     # Build summary
-    parts = []
-    if has_required_field_add:
-        fields = [d.field for d in diffs if d.diff_type in ("field_added_required", "field_optional_to_required")]
-        parts.append(f"New required field(s): {', '.join(fields)}")
-    if has_field_removed:
-        fields = [d.field for d in diffs if d.diff_type in ("field_removed", "nested_field_removed")]
-        parts.append(f"Removed field(s): {', '.join(fields)}")
-    if has_structure_change:
-        fields = [d.field for d in diffs if d.diff_type == "response_structure_changed"]
-        parts.append(f"Response structure changed: {', '.join(fields)}")
-    if has_type_change:
-        fields = [d.field for d in diffs if d.diff_type in ("field_type_changed", "nested_field_type_changed", "array_item_type_changed")]
-        parts.append(f"Type changed: {', '.join(fields)}")
-    if has_enum_narrowing:
-        fields = [d.field for d in diffs if d.diff_type == "enum_values_removed"]
-        parts.append(f"Enum values removed: {', '.join(fields)}")
-
+    parts = [
+        f"{label}: {', '.join(category_fields[category])}"
+        for category, label in _SUMMARY_LABELS
+        if category in category_fields
+    ]
     summary = "; ".join(parts) if parts else "Non-breaking changes detected"
 
     # Extract unique changed routes
-    changed_routes = sorted(set(f"{d.method.upper()} {d.path}" for d in diffs))
-
-    # Build changed fields list
-    changed_fields = [
-        {
-            "path": d.path,
-            "method": d.method,
-            "field": d.field,
-            "diff_type": d.diff_type,
-            "old_value": str(d.old_value) if d.old_value is not None else None,
-            "new_value": str(d.new_value) if d.new_value is not None else None,
-        }
-        for d in diffs
-    ]
+    changed_routes = sorted(changed_routes_set)
 
     return ClassifiedChange(
         is_breaking=is_breaking,
@@ -1,8 +1,9 @@
 """Service dependency graph builder and topological sorter."""
 
 from __future__ import annotations
-from typing import Dict, List, Set
-from dataclasses import dataclass
+from graphlib import CycleError, TopologicalSorter
+from typing import Dict, FrozenSet, List
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -10,6 +11,11 @@ class ServiceNode:
     """Represents a service in the dependency graph."""
     name: str
     depends_on: List[str]  # List of services this service depends on
+    # Set view of depends_on for membership checks; built once at construction.
+    dependency_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.dependency_set = frozenset(self.depends_on)
 
 
 class DependencyGraph:
@@ -39,37 +45,25 @@ class DependencyGraph:
                 ["billing-service", "dashboard-service"],  # Wave 1: Depend on api-core
                 ["invoice-service"]  # Wave 2: Depends on billing-service
             ]
+
+        Raises:
+            ValueError: If the graph has a cycle; the message names the
+                services on the cycle, not the services blocked behind it.
         """
-        # Count incoming edges for each node (number of dependencies)
-        in_degree = {name: 0 for name in self.nodes}
-        for node in self.nodes.values():
-            for dep in node.depends_on:
-                if dep in in_degree:
-                    in_degree[node.name] += 1
+        # Dependencies on services outside the graph do not block sorting.
+        sorter = TopologicalSorter(
+            {name: node.dependency_set & self.nodes.keys() for name, node in self.nodes.items()}
+        )
+        try:
+            sorter.prepare()
+        except CycleError as exc:
+            raise ValueError(f"Circular dependency detected in: {set(exc.args[1])}") from exc
 
         waves = []
-        processed = set()
-
-        while len(processed) < len(self.nodes):
-            # Find all nodes with no remaining dependencies
-            current_wave = [
-                name for name, degree in in_degree.items()
-                if degree == 0 and name not in processed
-            ]
-
-            if not current_wave:
-                # Circular dependency detected
-                remaining = set(self.nodes.keys()) - processed
-                raise ValueError(f"Circular dependency detected in: {remaining}")
-
-            waves.append(sorted(current_wave))
-            processed.update(current_wave)
-
-            # Reduce in-degree for nodes that depend on services in current wave
-            for service in current_wave:
-                for node in self.nodes.values():
-                    if node.name not in processed and service in node.depends_on:
-                        in_degree[node.name] -= 1
+        while sorter.is_active():
+            current_wave = sorted(sorter.get_ready())
+            waves.append(current_wave)
+            sorter.done(*current_wave)
 
         return waves
 
@@ -94,7 +88,7 @@ class DependencyGraph:
 
             # Find services that depend on this service
             for node in self.nodes.values():
-                if service in node.depends_on and node.name not in affected:
+                if service in node.dependency_set and node.name not in affected:
                     affected.add(node.name)
                     queue.append(node.name)
 
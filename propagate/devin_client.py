@@ -33,11 +33,21 @@ class DevinClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
-        self._client = httpx.AsyncClient(timeout=60.0)
+        # Keep-alive pool sized for a wave's concurrent session fetches.
+        self._client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
 
     async def close(self):
         await self._client.aclose()
 
+    async def __aenter__(self) -> DevinClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def _request_with_retry(
         self,
         method: str,
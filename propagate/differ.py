@@ -7,6 +7,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 
 @dataclass
 class ContractDiff:
@@ -21,7 +26,7 @@ class ContractDiff:
 def load_contract(path: str) -> dict:
     """Load and parse an OpenAPI YAML file."""
     with open(path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 
 def _resolve_ref(spec: dict, ref: str) -> dict:
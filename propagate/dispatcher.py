@@ -19,9 +19,9 @@ from src.entities.audit_log import AuditLog
 logger = logging.getLogger(__name__)
 
 
-def _guardrail_target_paths(bundle: RepoFixBundle) -> list[str]:
+def guardrail_target_paths(bundle: RepoFixBundle) -> list[str]:
     """Return all path classes a remediation is expected to touch."""
-    return sorted(set(bundle.client_paths + bundle.test_paths + bundle.frontend_paths))
+    return sorted({*bundle.client_paths, *bundle.test_paths, *bundle.frontend_paths})
 
 
 async def _log_transition(
@@ -46,14 +46,18 @@ async def dispatch_remediation_jobs(
     guardrails: Guardrails,
     change_id: int,
     wave_context_payload: dict | None = None,
+    client: DevinClient | None = None,
 ) -> list[RemediationJob]:
     """Dispatch Devin jobs concurrently, then return immediately.
 
     Creates remediation_job rows and dispatches Devin sessions.
     Each dispatch_one() gets its own AsyncSession to avoid concurrency issues.
+    Pass ``client`` to reuse an open DevinClient (and its connection pool)
+    across waves; the caller stays responsible for closing it.
     Does NOT poll for completion — use ``check_status`` to monitor.
     """
-    client = DevinClient()
+    if client is None:
+        client = DevinClient()
     is_sqlite = settings.database_url.startswith("sqlite")
     effective_parallel = 1 if is_sqlite else guardrails.max_parallel
     semaphore = asyncio.Semaphore(effective_parallel)
@@ -68,7 +72,7 @@ async def dispatch_remediation_jobs(
             # Each coroutine gets its own session to avoid AsyncSession sharing.
             async with async_session_factory() as own_db:
                 # Validate guardrails against all declared target paths.
-                violations = guardrails.validate_paths(_guardrail_target_paths(bundle))
+                violations = guardrails.validate_paths(guardrail_target_paths(bundle))
                 if violations:
                     logger.warning(
                         "Guardrail violation for %s: %s", bundle.target_service, violations
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
@@ -32,11 +33,16 @@ class Guardrails:
 
     def validate_paths(self, client_paths: list[str]) -> list[str]:
         """Check client_paths against protected_paths. Returns list of violations."""
+        protected_prefixes = tuple(self.protected_paths)
         violations = []
         for path in client_paths:
-            for protected in self.protected_paths:
-                if path.startswith(protected):
-                    violations.append(f"{path} is under protected path {protected}")
+            # One startswith() over all prefixes per path; only hits are expanded.
+            if path.startswith(protected_prefixes):
+                violations.extend(
+                    f"{path} is under protected path {protected}"
+                    for protected in protected_prefixes
+                    if path.startswith(protected)
+                )
         return violations
 
     def check_can_merge(self, ci_passed: bool) -> tuple[bool, str]:
@@ -58,7 +64,6 @@ class GuardrailViolation(Exception):
 
 def load_guardrails() -> Guardrails:
     """Load guardrails from environment or defaults."""
-    import os
     return Guardrails(
         max_parallel=int(os.getenv("PROPAGATE_MAX_PARALLEL", "3")),
         auto_merge=os.getenv("PROPAGATE_AUTO_MERGE", "false").lower() == "true",
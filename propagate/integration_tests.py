@@ -6,7 +6,7 @@ import time
 import httpx
 import logging
 import os
-from typing import List, Dict
+from typing import Dict
 
 logger = logging.getLogger(__name__)
 
@@ -7,6 +7,8 @@ from pathlib import Path
 
 import yaml
 
+from propagate.differ import YamlLoader
+
 
 @dataclass
 class ServiceInfo:
@@ -17,6 +19,11 @@ class ServiceInfo:
     frontend_paths: list[str] = field(default_factory=list)
     depends_on: list[str] = field(default_factory=list)
     include_in_top_callers: bool = True
+    # Membership view of depends_on; the list keeps declaration order for display.
+    depends_on_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.depends_on_set = frozenset(self.depends_on)
 
 
 def load_service_map(path: str | None = None) -> dict[str, ServiceInfo]:
@@ -26,7 +33,7 @@ def load_service_map(path: str | None = None) -> dict[str, ServiceInfo]:
 
     try:
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
     except OSError:
         return {}
 
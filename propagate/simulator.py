@@ -7,7 +7,6 @@ deep pre-merge analysis of high-risk consumers.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from typing import Any
@@ -123,7 +122,7 @@ def simulate_contract_changes(
     dependent_services = {
         name: info
         for name, info in service_map.items()
-        if "api-core" in info.depends_on
+        if "api-core" in info.depends_on_set
     }
 
     if not dependent_services:
@@ -8,17 +8,22 @@ Provides:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 from contextlib import suppress
 from datetime import datetime, timezone
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from propagate.devin_client import DevinClient
-from propagate.check_status import _fetch_github_pr_metadata, _find_replacement_open_pr, sync_job_statuses
+from propagate.check_status import (
+    _fetch_github_pr_metadata,
+    _find_replacement_open_pr,
+    _github_client,
+    sync_job_statuses,
+)
 from propagate.notify import emit_webhook
 from propagate.service_map import load_service_map
 from src.config import settings
@@ -276,11 +281,11 @@ def _build_recovery_complete(
 ) -> dict:
     """Build a recovery_complete webhook payload from a fully-merged change."""
     try:
-        summary = json.loads(change.summary_json or "{}").get("summary", "")
+        summary = orjson.loads(change.summary_json or "{}").get("summary", "")
     except Exception:
         summary = ""
     try:
-        changed_routes = json.loads(change.changed_routes_json or "[]")
+        changed_routes = orjson.loads(change.changed_routes_json or "[]")
         if not isinstance(changed_routes, list):
             changed_routes = []
     except Exception:
@@ -343,7 +348,7 @@ async def _latest_or_create_live_change(
         head_ref="devin-live-sync",
         is_breaking=True,
         severity="high",
-        summary_json=json.dumps({"summary": summary}),
+        summary_json=orjson.dumps({"summary": summary}).decode(),
         changed_routes_json="[]",
         changed_fields_json="[]",
     )
@@ -386,6 +391,7 @@ async def sync_devin_sessions(
             "total_fetched": 0,
             "detail": str(exc),
         }
+    gh_client = _github_client() if settings.github_token else None
     try:
         sessions = await client.list_sessions(limit=limit)
         async with _SYNC_MUTEX:
@@ -414,7 +420,7 @@ async def sync_devin_sessions(
 
                 raw_pr_url = _extract_pr_url(detail) or _extract_pr_url(sess)
                 pr_metadata = (
-                    await _fetch_github_pr_metadata(raw_pr_url)
+                    await _fetch_github_pr_metadata(raw_pr_url, gh_client=gh_client)
                     if raw_pr_url
                     else {"state": "unknown", "merged": False, "head_sha": ""}
                 )
@@ -462,11 +468,12 @@ async def sync_devin_sessions(
                         preferred_title=str(pr_metadata.get("title") or ""),
                         preferred_author_login=str(pr_metadata.get("author_login") or ""),
                         exclude_pr_url=raw_pr_url,
+                        gh_client=gh_client,
                     )
                     # Fallback: search by repo URL if PR-based lookup failed.
                     if not replacement_pr and repo:
                         replacement_pr = await _find_replacement_open_pr(
-                            repo, exclude_pr_url=raw_pr_url,
+                            repo, exclude_pr_url=raw_pr_url, gh_client=gh_client,
                         )
                     if replacement_pr:
                         pr_url = replacement_pr
@@ -606,6 +613,8 @@ async def sync_devin_sessions(
         }
     finally:
         await client.close()
+        if gh_client is not None:
+            await gh_client.aclose()
 
 
 async def run_sync_loop(
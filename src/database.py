@@ -1,5 +1,6 @@
 """Database connection and session management."""
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -55,6 +56,8 @@ if "sqlite" in settings.database_url:
         # WAL allows readers and a single writer concurrently, reducing lock errors.
         cursor.execute("PRAGMA journal_mode=WAL;")
         cursor.execute("PRAGMA synchronous=NORMAL;")
+        cursor.execute("PRAGMA temp_store=MEMORY;")
+        cursor.execute("PRAGMA mmap_size=268435456;")
         cursor.execute("PRAGMA busy_timeout=30000;")
         cursor.execute("PRAGMA foreign_keys=ON;")
         cursor.close()
@@ -84,5 +87,17 @@ async def init_db():
         command.upgrade(alembic_cfg, "head")
 
 
+async def warm_pool(size: int) -> None:
+    """Open up to ``size`` pooled connections concurrently so later queries skip connect.
+
+    No-op for SQLite, where connecting is a local file open.
+    """
+    if size <= 0 or "sqlite" in settings.database_url:
+        return
+    size = min(size, engine.pool.size())
+    conns = await asyncio.gather(*(engine.connect() for _ in range(size)))
+    await asyncio.gather(*(conn.close() for conn in conns))
+
+
 async def close_db() -> None:
     await engine.dispose()
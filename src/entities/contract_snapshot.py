@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 
-from sqlalchemy import String, DateTime, Text, Integer
+from sqlalchemy import String, DateTime, Index, Text, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database import Base
@@ -10,6 +10,11 @@ from src.database import Base
 
 class ContractSnapshot(Base):
     __tablename__ = "contract_snapshots"
+    __table_args__ = (
+        # Covers the latest-snapshot lookup (ORDER BY captured_at DESC LIMIT 1
+        # selecting id, version_hash) as an index-only backward scan.
+        Index("ix_contract_snapshots_latest", "captured_at", "id", "version_hash"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     version_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, String, DateTime, Text, Integer, ForeignKey
+from sqlalchemy import Boolean, String, DateTime, Text, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database import Base
@@ -21,9 +21,13 @@ class JobStatus(str, enum.Enum):
 
 class RemediationJob(Base):
     __tablename__ = "remediation_jobs"
+    __table_args__ = (
+        # Wave polling filters on status NOT IN (...) AND devin_run_id IS NOT NULL.
+        Index("ix_remediation_jobs_poll", "status", "devin_run_id"),
+    )
 
     job_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    change_id: Mapped[int] = mapped_column(Integer, ForeignKey("contract_changes.id"), nullable=False)
+    change_id: Mapped[int] = mapped_column(Integer, ForeignKey("contract_changes.id"), nullable=False, index=True)
     target_repo: Mapped[str] = mapped_column(String(500), nullable=False)
     status: Mapped[str] = mapped_column(String(30), default=JobStatus.QUEUED.value)
     devin_run_id: Mapped[str] = mapped_column(String(200), nullable=True)
@@ -20,6 +20,7 @@ from sqlalchemy.orm import selectinload
 from src.database import get_db
 from src.config import settings
 from propagate.check_status import sync_job_statuses
+from propagate.differ import YamlLoader
 from propagate.sync_devin import sync_devin_sessions
 from src.progressive_seed import (
     advance_progressive_demo,
@@ -52,6 +53,8 @@ _last_live_refresh_time: float = 0.0
 _devin_auth_failed: bool = False  # circuit breaker for invalid API keys
 
 CONTRACT_PATH = Path(__file__).resolve().parent.parent.parent / "openapi.yaml"
+# Parsed openapi.yaml keyed by version hash; holds only the latest contract.
+_parsed_contract_cache: dict[str, dict] = {}
 _JOB_STATUS_PRIORITY = {
     "merged": 5,
     "awaiting_merge": 4,
@@ -200,15 +203,26 @@ async def _refresh_live_jobs_if_due(
             logger.exception("Live contract refresh failed")
 
 
+def _parse_contract(content: bytes, version_hash: str) -> dict:
+    """Parse the contract YAML, reusing the last parse while the hash is unchanged."""
+    parsed = _parsed_contract_cache.get(version_hash)
+    if parsed is None:
+        parsed = yaml.load(content, Loader=YamlLoader)
+        _parsed_contract_cache.clear()
+        _parsed_contract_cache[version_hash] = parsed
+    return parsed
+
+
 @router.get("/current", response_model=ContractCurrentResponse)
 async def get_current_contract():
     """Return the current openapi.yaml content and its version hash."""
     if not CONTRACT_PATH.exists():
         raise HTTPException(status_code=404, detail="openapi.yaml not found")
 
-    content = CONTRACT_PATH.read_text()
-    parsed = yaml.safe_load(content)
-    version_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+    # Hash the raw bytes (matching the propagation CLI) and let libyaml decode them.
+    content = CONTRACT_PATH.read_bytes()
+    version_hash = hashlib.sha256(content).digest()[:8].hex()
+    parsed = _parse_contract(content, version_hash)
 
     return ContractCurrentResponse(
         version_hash=version_hash,
@@ -1,5 +1,9 @@
 """Tests for the check_status module."""
 
+import asyncio
+import logging
+
+import httpx
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch
@@ -7,10 +11,22 @@ from unittest.mock import AsyncMock, patch
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
+from src.config import settings
 from src.database import Base
 from src.entities.remediation_job import RemediationJob, JobStatus
 from src.entities.audit_log import AuditLog
-from propagate.check_status import check_jobs, CI_UNKNOWN_MAX_ATTEMPTS
+from propagate.check_status import (
+    CI_UNKNOWN_MAX_ATTEMPTS,
+    GITHUB_MAX_RETRIES,
+    _GithubRateLimitTransport,
+    _etag_cache,
+    _fetch_github_ci_status,
+    _fetch_github_pr_metadata,
+    check_jobs,
+    sync_job_statuses,
+)
+from propagate.__main__ import _configure_logging
+from propagate.guardrails import Guardrails
 
 
 test_engine = create_async_engine("sqlite+aiosqlite:///", echo=False)
@@ -74,6 +90,34 @@ class TestCheckJobs:
             assert job.status == JobStatus.AWAITING_MERGE.value
             assert job.pr_url == "https://github.com/org/test/pull/1"
 
+    @pytest.mark.asyncio
+    async def test_progress_lines_reach_stdout_under_propagate_cli_logging(self, capsys):
+        await _create_job()
+
+        mock_client = AsyncMock()
+        mock_client.get_session.return_value = {
+            "status_enum": "running",
+            "structured_output": {
+                "pull_request": {"url": "https://github.com/org/test/pull/1"},
+            },
+        }
+
+        loggers = [logging.getLogger(name) for name in ("propagate.__main__", "propagate.check_status")]
+        saved = [(lg.handlers[:], lg.propagate, lg.level) for lg in loggers]
+        try:
+            _configure_logging()
+            with patch("propagate.check_status.async_session", TestSession), \
+                 patch("propagate.check_status.DevinClient", return_value=mock_client):
+                await check_jobs()
+        finally:
+            for lg, (handlers, propagate, level) in zip(loggers, saved):
+                lg.handlers[:] = handlers
+                lg.propagate = propagate
+                lg.setLevel(level)
+
+        out = capsys.readouterr().out
+        assert "[org/test-service] -> AWAITING_MERGE: https://github.com/org/test/pull/1" in out
+
     @pytest.mark.asyncio
     async def test_needs_human_on_blocked(self):
         """Job transitions to NEEDS_HUMAN when Devin is blocked."""
@@ -329,3 +373,363 @@ class TestCheckJobs:
             job = result.scalar_one()
             assert job.status == JobStatus.NEEDS_HUMAN.value
             assert job.error_summary == "Devin stopped without PR"
+
+    @pytest.mark.asyncio
+    async def test_devin_sessions_polled_concurrently(self):
+        first_id = await _create_job(devin_run_id="devin_a")
+        second_id = await _create_job(devin_run_id="devin_b")
+        both_polling = asyncio.Event()
+        in_flight = 0
+
+        async def get_session(session_id):
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == 2:
+                both_polling.set()
+            # Only returns once the other poll is in flight too.
+            await asyncio.wait_for(both_polling.wait(), timeout=1)
+            return {"status_enum": "blocked", "structured_output": {}}
+
+        mock_client = AsyncMock()
+        mock_client.get_session.side_effect = get_session
+
+        with patch("propagate.check_status.async_session", TestSession), \
+             patch("propagate.check_status.DevinClient", return_value=mock_client):
+            await check_jobs()
+
+        async with TestSession() as db:
+            result = await db.execute(
+                select(RemediationJob.status).where(RemediationJob.job_id.in_([first_id, second_id]))
+            )
+            assert set(result.scalars().all()) == {JobStatus.NEEDS_HUMAN.value}
+
+    @pytest.mark.asyncio
+    async def test_jobs_reconciled_against_github_concurrently(self):
+        first_id = await _create_job(devin_run_id="devin_a", pr_url="https://github.com/org/a/pull/1")
+        second_id = await _create_job(devin_run_id="devin_b", pr_url="https://github.com/org/b/pull/2")
+        both_checking = asyncio.Event()
+        in_flight = 0
+
+        async def fetch_ci_status(pr_url, gh_client=None, metadata=None):
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == 2:
+                both_checking.set()
+            # Only returns once the other job's CI lookup is in flight too.
+            await asyncio.wait_for(both_checking.wait(), timeout=1)
+            return True, "passed"
+
+        mock_client = AsyncMock()
+        mock_client.get_session.return_value = {"status_enum": "stopped", "structured_output": {}}
+
+        with patch("propagate.check_status.async_session", TestSession), \
+             patch("propagate.check_status.DevinClient", return_value=mock_client), \
+             patch("propagate.check_status._fetch_github_ci_status", side_effect=fetch_ci_status), \
+             patch("propagate.check_status._fetch_pr_changed_files", return_value=["src/client.py"]):
+            await check_jobs()
+
+        async with TestSession() as db:
+            result = await db.execute(
+                select(RemediationJob.status).where(RemediationJob.job_id.in_([first_id, second_id]))
+            )
+            assert set(result.scalars().all()) == {JobStatus.MERGED.value}
+            audit = await db.execute(select(AuditLog.job_id).order_by(AuditLog.id))
+            # Audit rows are still written in job order (most recently updated first).
+            assert audit.scalars().all() == [second_id, first_id]
+
+    @pytest.mark.asyncio
+    async def test_github_calls_share_one_client_per_sync(self):
+        job_id = await _create_job(pr_url="https://github.com/org/test/pull/1")
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+            if request.url.path.endswith("/check-runs"):
+                return httpx.Response(200, json={"check_runs": [{"status": "completed", "conclusion": "success"}]})
+            if request.url.path.endswith("/files"):
+                return httpx.Response(200, json=[{"filename": "src/client.py"}])
+            return httpx.Response(200, json={"state": "open", "merged": False, "head": {"sha": "abc"}})
+
+        created: list[httpx.AsyncClient] = []
+
+        def github_client():
+            gh = httpx.AsyncClient(base_url="https://api.github.com", transport=httpx.MockTransport(handler))
+            created.append(gh)
+            return gh
+
+        mock_client = AsyncMock()
+        mock_client.get_session.return_value = {"status_enum": "stopped", "structured_output": {}}
+
+        with patch("propagate.check_status.async_session", TestSession), \
+             patch("propagate.check_status.DevinClient", return_value=mock_client), \
+             patch.object(settings, "github_token", "ghp_test"), \
+             patch("propagate.check_status._github_client", side_effect=github_client):
+            await check_jobs()
+
+        assert len(created) == 1
+        assert created[0].is_closed
+        # The PR is fetched once and reused for the CI status lookup.
+        assert requested == [
+            "/repos/org/test/pulls/1",
+            "/repos/org/test/commits/abc/check-runs",
+            "/repos/org/test/pulls/1/files",
+        ]
+        async with TestSession() as db:
+            job = await db.get(RemediationJob, job_id)
+            assert job.status == JobStatus.MERGED.value
+
+    @pytest.mark.asyncio
+    async def test_ci_unknown_attempts_counted_per_job(self):
+        exhausted_id = await _create_job(
+            status=JobStatus.RUNNING.value,
+            devin_run_id="devin_a",
+            pr_url="https://github.com/org/a/pull/1",
+        )
+        fresh_id = await _create_job(
+            status=JobStatus.RUNNING.value,
+            devin_run_id="devin_b",
+            pr_url="https://github.com/org/b/pull/2",
+        )
+        async with TestSession() as db:
+            for i in range(CI_UNKNOWN_MAX_ATTEMPTS):
+                db.add(AuditLog(
+                    job_id=exhausted_id,
+                    old_status="awaiting_merge",
+                    new_status="awaiting_merge",
+                    detail=f"CI status unknown, holding at AWAITING_MERGE (attempt {i + 1}/{CI_UNKNOWN_MAX_ATTEMPTS}): url",
+                ))
+            await db.commit()
+
+        mock_client = AsyncMock()
+        mock_client.get_session.return_value = {"status_enum": "stopped", "structured_output": {}}
+
+        with patch("propagate.check_status.async_session", TestSession), \
+             patch("propagate.check_status.DevinClient", return_value=mock_client), \
+             patch("propagate.check_status._fetch_github_ci_status", return_value=(False, "unknown")):
+            await check_jobs()
+
+        async with TestSession() as db:
+            exhausted = await db.get(RemediationJob, exhausted_id)
+            fresh = await db.get(RemediationJob, fresh_id)
+            assert exhausted.status == JobStatus.CI_FAILED.value
+            assert fresh.status == JobStatus.AWAITING_MERGE.value
+
+
+class TestConditionalGithubRequests:
+    @pytest.mark.asyncio
+    async def test_unchanged_check_runs_reuse_cached_result_via_etag(self):
+        if_none_match: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if_none_match.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"ETag": '"v1"'},
+                json={"check_runs": [{"status": "in_progress", "conclusion": None}]},
+            )
+
+        metadata = {"state": "open", "merged": False, "head_sha": "abc"}
+        with patch.object(settings, "github_token", "ghp_test"), \
+             patch.dict(_etag_cache, clear=True):
+            async with httpx.AsyncClient(
+                base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+            ) as gh:
+                first = await _fetch_github_ci_status(
+                    "https://github.com/org/test/pull/1", gh_client=gh, metadata=metadata
+                )
+                second = await _fetch_github_ci_status(
+                    "https://github.com/org/test/pull/1", gh_client=gh, metadata=metadata
+                )
+
+        assert first == second == (False, "pending")
+        assert if_none_match == [None, '"v1"']
+
+    @pytest.mark.asyncio
+    async def test_unchanged_pr_metadata_is_served_from_cache_on_304(self):
+        responses = [
+            httpx.Response(
+                200,
+                headers={"ETag": '"pr1"'},
+                json={"state": "open", "merged": False, "head": {"sha": "abc", "ref": "fix"}},
+            ),
+            httpx.Response(304),
+        ]
+
+        with patch.object(settings, "github_token", "ghp_test"), \
+             patch.dict(_etag_cache, clear=True):
+            async with httpx.AsyncClient(
+                base_url="https://api.github.com",
+                transport=httpx.MockTransport(lambda request: responses.pop(0)),
+            ) as gh:
+                first = await _fetch_github_pr_metadata("https://github.com/org/test/pull/1", gh_client=gh)
+                first["state"] = "mutated"
+                second = await _fetch_github_pr_metadata("https://github.com/org/test/pull/1", gh_client=gh)
+
+        assert second["state"] == "open"
+        assert second["head_sha"] == "abc"
+
+
+class TestGithubRateLimitTransport:
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_request_after_retry_after(self):
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+        transport = _GithubRateLimitTransport(httpx.MockTransport(lambda request: responses.pop(0)))
+        sleep_mock = AsyncMock()
+
+        with patch("propagate.check_status.asyncio.sleep", sleep_mock):
+            async with httpx.AsyncClient(base_url="https://api.github.com", transport=transport) as gh:
+                resp = await gh.get("/repos/org/test/pulls/1")
+
+        assert resp.status_code == 200
+        sleep_mock.assert_awaited_once_with(3.0)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            return httpx.Response(429)
+
+        transport = _GithubRateLimitTransport(httpx.MockTransport(handler))
+        with patch("propagate.check_status.asyncio.sleep", AsyncMock()):
+            async with httpx.AsyncClient(base_url="https://api.github.com", transport=transport) as gh:
+                resp = await gh.get("/repos/org/test/pulls/1")
+
+        assert resp.status_code == 429
+        assert calls == GITHUB_MAX_RETRIES + 1
+
+    @pytest.mark.asyncio
+    async def test_holds_requests_until_reset_when_quota_is_low(self):
+        reset_at = 1_000_030
+        transport = _GithubRateLimitTransport(httpx.MockTransport(
+            lambda request: httpx.Response(
+                200,
+                headers={"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(reset_at)},
+                json={},
+            )
+        ))
+        sleep_mock = AsyncMock()
+
+        with patch("propagate.check_status.asyncio.sleep", sleep_mock), \
+             patch("propagate.check_status.time.time", return_value=1_000_000):
+            async with httpx.AsyncClient(base_url="https://api.github.com", transport=transport) as gh:
+                await gh.get("/repos/org/test/pulls/1")
+                sleep_mock.assert_not_awaited()
+                await gh.get("/repos/org/test/pulls/2")
+
+        sleep_mock.assert_awaited_once_with(30)
+
+    @pytest.mark.asyncio
+    async def test_plain_forbidden_is_not_retried(self):
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            return httpx.Response(403, json={"message": "Resource not accessible"})
+
+        transport = _GithubRateLimitTransport(httpx.MockTransport(handler))
+        async with httpx.AsyncClient(base_url="https://api.github.com", transport=transport) as gh:
+            resp = await gh.get("/repos/org/test/pulls/1")
+
+        assert resp.status_code == 403
+        assert calls == 1
+
+
+class _OtherWorkerLockSession(AsyncSession):
+    """Test session that treats ``held_job_ids`` as row-locked by another sync.
+
+    SQLite ignores FOR UPDATE SKIP LOCKED, so the locking select drops those
+    rows itself, as Postgres would. ``for_update_seen`` records whether any
+    statement asked for row locks.
+    """
+
+    held_job_ids: list[int] = []
+    for_update_seen = False
+
+    async def execute(self, statement, *args, **kwargs):
+        if getattr(statement, "_for_update_arg", None) is not None:
+            type(self).for_update_seen = True
+            statement = statement.where(RemediationJob.job_id.notin_(self.held_job_ids))
+        return await super().execute(statement, *args, **kwargs)
+
+
+class TestSyncJobStatusesSummary:
+    @pytest.mark.asyncio
+    async def test_terminal_jobs_counted_without_polling(self):
+        await _create_job(status=JobStatus.MERGED.value, devin_run_id="devin_done")
+        await _create_job(status=JobStatus.RUNNING.value, devin_run_id="devin_live")
+
+        mock_client = AsyncMock()
+        mock_client.get_session.return_value = {"status_enum": "running", "structured_output": {}}
+
+        with patch("propagate.check_status.DevinClient", return_value=mock_client):
+            async with TestSession() as db:
+                summary = await sync_job_statuses(db=db)
+
+        mock_client.get_session.assert_awaited_once_with("devin_live")
+        assert summary["checked"] == 2
+        assert summary["merged"] == 1
+        assert summary["running"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rows_locked_by_another_sync_are_reported_as_skipped(self):
+        held_id = await _create_job(devin_run_id="devin_held")
+        await _create_job(devin_run_id="devin_free")
+        mock_client = AsyncMock()
+        mock_client.get_session.return_value = {"status_enum": "running", "structured_output": {}}
+        LockSession = async_sessionmaker(test_engine, class_=_OtherWorkerLockSession, expire_on_commit=False)
+
+        with patch("propagate.check_status.DevinClient", return_value=mock_client), \
+             patch.object(_OtherWorkerLockSession, "held_job_ids", [held_id]), \
+             patch.object(_OtherWorkerLockSession, "for_update_seen", False):
+            async with LockSession() as db:
+                summary = await sync_job_statuses(db=db, lock_rows=True)
+            assert _OtherWorkerLockSession.for_update_seen
+
+        mock_client.get_session.assert_awaited_once_with("devin_free")
+        assert summary["checked"] == 1
+        assert summary["running"] == 1
+        assert summary["skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rows_not_locked_unless_requested(self):
+        await _create_job()
+        mock_client = AsyncMock()
+        mock_client.get_session.return_value = {"status_enum": "running", "structured_output": {}}
+        LockSession = async_sessionmaker(test_engine, class_=_OtherWorkerLockSession, expire_on_commit=False)
+
+        with patch("propagate.check_status.DevinClient", return_value=mock_client), \
+             patch.object(_OtherWorkerLockSession, "for_update_seen", False):
+            async with LockSession() as db:
+                summary = await sync_job_statuses(db=db)
+            assert not _OtherWorkerLockSession.for_update_seen
+
+        assert summary["checked"] == 1
+        assert summary["skipped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_changed_files_not_fetched_without_protected_paths(self):
+        job_id = await _create_job(pr_url="https://github.com/org/test/pull/1")
+        mock_client = AsyncMock()
+        mock_client.get_session.return_value = {"status_enum": "stopped", "structured_output": {}}
+        fetch_files = AsyncMock(return_value=["infra/main.tf"])
+
+        with patch("propagate.check_status.DevinClient", return_value=mock_client), \
+             patch("propagate.check_status.load_guardrails", return_value=Guardrails(protected_paths=[])), \
+             patch("propagate.check_status._fetch_github_ci_status", AsyncMock(return_value=(True, "passed"))), \
+             patch("propagate.check_status._fetch_pr_changed_files", fetch_files):
+            async with TestSession() as db:
+                await sync_job_statuses(db=db)
+
+        fetch_files.assert_not_awaited()
+        async with TestSession() as db:
+            job = await db.get(RemediationJob, job_id)
+            assert job.status == JobStatus.MERGED.value
@@ -48,6 +48,26 @@ class TestTopologicalSort:
         with pytest.raises(ValueError, match="Circular dependency"):
             g.topological_sort()
 
+    def test_circular_dependency_error_names_cycle_members(self):
+        g = DependencyGraph()
+        g.add_service("root", depends_on=[])
+        g.add_service("a", depends_on=["root", "b"])
+        g.add_service("b", depends_on=["a"])
+        g.add_service("downstream", depends_on=["a"])
+        with pytest.raises(ValueError) as excinfo:
+            g.topological_sort()
+        message = str(excinfo.value)
+        assert "'a'" in message and "'b'" in message
+        # Services merely blocked by the cycle are not listed.
+        assert "'downstream'" not in message
+        assert "'root'" not in message
+
+    def test_depends_on_keeps_declared_list(self):
+        g = DependencyGraph()
+        g.add_service("b", depends_on=["a", "a"])
+        assert g.nodes["b"].depends_on == ["a", "a"]
+        assert g.nodes["b"].dependency_set == frozenset({"a"})
+
     def test_empty_graph(self):
         g = DependencyGraph()
         assert g.topological_sort() == []
@@ -60,6 +80,12 @@ class TestTopologicalSort:
         waves = g.topological_sort()
         assert waves == [["a"]]
 
+    def test_duplicate_dependency_counted_once(self):
+        g = DependencyGraph()
+        g.add_service("a", depends_on=[])
+        g.add_service("b", depends_on=["a", "a"])
+        assert g.topological_sort() == [["a"], ["b"]]
+
 
 class TestGetAffectedServices:
     def test_direct_dependency(self):
@@ -103,3 +103,10 @@ class TestDevinClient:
             f"{client.base_url}/sessions",
             params={"limit": 10, "status": "running"},
         )
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_http_client(self):
+        async with DevinClient(api_key="test-key") as client:
+            assert not client._client.is_closed
+
+        assert client._client.is_closed
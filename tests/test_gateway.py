@@ -721,6 +721,26 @@ class TestContracts:
         assert resp.status_code == 200
         assert resp.json()["id"] == change_id
 
+    @pytest.mark.asyncio
+    async def test_current_contract_parses_yaml_once_per_version(self, client, monkeypatch):
+        monkeypatch.setattr(contracts_routes, "_parsed_contract_cache", {})
+        real_load = contracts_routes.yaml.load
+        calls = 0
+
+        def counting_load(content, Loader):
+            nonlocal calls
+            calls += 1
+            return real_load(content, Loader=Loader)
+
+        monkeypatch.setattr(contracts_routes.yaml, "load", counting_load)
+
+        first = await client.get("/api/v1/contracts/current")
+        second = await client.get("/api/v1/contracts/current")
+
+        assert first.status_code == 200
+        assert first.json() == second.json()
+        assert calls == 1
+
 
 class TestApiKeyAuth:
     @pytest.mark.asyncio
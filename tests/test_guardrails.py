@@ -108,6 +108,13 @@ class TestEdgeCases:
         violations = g.validate_paths(["infrastructure/main.tf"])
         assert len(violations) == 0
 
+    def test_overlapping_protected_prefixes_each_reported(self):
+        g = Guardrails(protected_paths=["infra/", "infra/prod/"])
+        assert g.validate_paths(["src/app.py", "infra/prod/db.tf"]) == [
+            "infra/prod/db.tf is under protected path infra/",
+            "infra/prod/db.tf is under protected path infra/prod/",
+        ]
+
     def test_guardrail_violation_exception(self):
         """GuardrailViolation is a proper exception class."""
         from propagate.guardrails import GuardrailViolation
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
@@ -9,7 +10,13 @@ import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
-from propagate.__main__ import _send_context_to_wave, _build_wave_context_payload
+from propagate.__main__ import (
+    _build_wave_context_payload,
+    _classify_files,
+    _extract_fix_insights,
+    _send_context_to_wave,
+    _wait_for_wave_completion,
+)
 from src.database import Base
 from src.entities.contract_change import ContractChange
 from src.entities.remediation_job import RemediationJob, JobStatus
@@ -34,6 +41,36 @@ async def dispose_test_engine():
     await test_engine.dispose()
 
 
+_JOB_DEFAULTS = {
+    "target_repo": "https://github.com/org/billing-service",
+    "status": JobStatus.MERGED.value,
+    "bundle_hash": "hash1",
+}
+
+
+async def _create_change_with_jobs(*jobs: dict) -> list[int]:
+    """Create one ContractChange and a RemediationJob per overrides dict; return job ids."""
+    async with TestSession() as db:
+        change = ContractChange(
+            base_ref="old",
+            head_ref="new",
+            is_breaking=True,
+            severity="high",
+            summary_json='{"summary":"x"}',
+            changed_routes_json="[]",
+            changed_fields_json="[]",
+        )
+        db.add(change)
+        await db.flush()
+        rows = [
+            RemediationJob(change_id=change.id, **{**_JOB_DEFAULTS, **overrides})
+            for overrides in jobs
+        ]
+        db.add_all(rows)
+        await db.commit()
+        return [row.job_id for row in rows]
+
+
 class TestWaveContextMessaging:
     @pytest.mark.asyncio
     async def test_send_context_includes_wave_context_payload(self):
@@ -43,19 +80,19 @@ class TestWaveContextMessaging:
             SimpleNamespace(devin_run_id=None),
         ]
 
-        with patch("propagate.__main__.DevinClient", return_value=mock_client):
-            await _send_context_to_wave(
-                wave_jobs=jobs,
-                wave_idx=2,
-                context_payload={
-                    "source_wave_index": 1,
-                    "summary_text": "Wave 1 complete",
-                    "upstream_fix_summaries": [{"repo": "billing-service", "status": "merged"}],
-                    "notable_patterns": ["updated API client callsites"],
-                    "test_fixtures_changed": ["tests/fixtures/session.json"],
-                    "ci_green_prs": ["https://github.com/org/repo/pull/1"],
-                },
-            )
+        await _send_context_to_wave(
+            client=mock_client,
+            wave_jobs=jobs,
+            wave_idx=2,
+            context_payload={
+                "source_wave_index": 1,
+                "summary_text": "Wave 1 complete",
+                "upstream_fix_summaries": [{"repo": "billing-service", "status": "merged"}],
+                "notable_patterns": ["updated API client callsites"],
+                "test_fixtures_changed": ["tests/fixtures/session.json"],
+                "ci_green_prs": ["https://github.com/org/repo/pull/1"],
+            },
+        )
 
         mock_client.send_message.assert_awaited_once()
         args, kwargs = mock_client.send_message.await_args
@@ -69,31 +106,10 @@ class TestWaveContextMessaging:
 
     @pytest.mark.asyncio
     async def test_build_payload_extracts_patterns_and_fixtures(self):
-        async with TestSession() as db:
-            change = ContractChange(
-                base_ref="old",
-                head_ref="new",
-                is_breaking=True,
-                severity="high",
-                summary_json='{"summary":"x"}',
-                changed_routes_json='["POST /api/v1/sessions"]',
-                changed_fields_json="[]",
-            )
-            db.add(change)
-            await db.flush()
-
-            job = RemediationJob(
-                change_id=change.id,
-                target_repo="https://github.com/org/billing-service",
-                status=JobStatus.MERGED.value,
-                devin_run_id="sess_alpha",
-                pr_url="https://github.com/org/billing-service/pull/12",
-                bundle_hash="hash1",
-            )
-            db.add(job)
-            await db.commit()
-            await db.refresh(job)
-            job_id = job.job_id
+        [job_id] = await _create_change_with_jobs({
+            "devin_run_id": "sess_alpha",
+            "pr_url": "https://github.com/org/billing-service/pull/12",
+        })
 
         mock_client = AsyncMock()
         mock_client.get_session.return_value = {
@@ -107,9 +123,8 @@ class TestWaveContextMessaging:
             }
         }
 
-        with patch("propagate.__main__.async_session", TestSession), \
-             patch("propagate.__main__.DevinClient", return_value=mock_client):
-            payload = await _build_wave_context_payload([job_id], wave_idx=1)
+        async with TestSession() as db:
+            payload = await _build_wave_context_payload(db, mock_client, [job_id], wave_idx=1)
 
         assert payload is not None
         assert payload["source_wave_index"] == 1
@@ -119,3 +134,114 @@ class TestWaveContextMessaging:
         assert "updated API client callsites" in payload["notable_patterns"]
         assert "updated tests/fixtures for contract compatibility" in payload["notable_patterns"]
         assert "tests/fixtures/session_response.json" in payload["test_fixtures_changed"]
+
+    @pytest.mark.asyncio
+    async def test_build_payload_times_out_slow_session_fetch(self):
+        [job_id] = await _create_change_with_jobs({
+            "devin_run_id": "sess_slow",
+            "pr_url": "https://github.com/org/billing-service/pull/12",
+        })
+
+        async def hang(_session_id):
+            await asyncio.Event().wait()
+
+        mock_client = AsyncMock()
+        mock_client.get_session.side_effect = hang
+
+        with patch("propagate.__main__.WAVE_SESSION_FETCH_TIMEOUT", 0.01):
+            async with TestSession() as db:
+                payload = await _build_wave_context_payload(db, mock_client, [job_id], wave_idx=1)
+
+        assert payload is not None
+        summary = payload["upstream_fix_summaries"][0]
+        assert summary["repo"] == "billing-service"
+        assert summary["changed_files"] == []
+        # The caller owns the shared client.
+        mock_client.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_build_payload_skips_fetch_for_jobs_without_session(self):
+        [job_id] = await _create_change_with_jobs({
+            "target_repo": "https://github.com/org/billing-service/",
+            "status": JobStatus.NEEDS_HUMAN.value,
+        })
+
+        mock_client = AsyncMock()
+        async with TestSession() as db:
+            payload = await _build_wave_context_payload(db, mock_client, [job_id], wave_idx=0)
+
+        mock_client.get_session.assert_not_awaited()
+        assert payload["upstream_fix_summaries"][0]["repo"] == "billing-service"
+        assert payload["notable_patterns"] == []
+
+    @pytest.mark.asyncio
+    async def test_wait_for_wave_completion_counts_pending_with_backoff(self):
+        [job_id] = await _create_change_with_jobs({
+            "status": JobStatus.RUNNING.value,
+            "devin_run_id": "sess_alpha",
+        })
+
+        polls = 0
+
+        async def fake_check_jobs():
+            nonlocal polls
+            polls += 1
+            if polls == 3:
+                async with TestSession() as db:
+                    row = await db.get(RemediationJob, job_id)
+                    row.status = JobStatus.MERGED.value
+                    await db.commit()
+
+        sleep_mock = AsyncMock()
+        with patch("propagate.__main__.check_jobs", fake_check_jobs), \
+             patch("propagate.__main__.asyncio.sleep", sleep_mock):
+            async with TestSession() as db:
+                completed = await _wait_for_wave_completion(db, [job_id], wave_idx=0)
+
+        assert completed is True
+        assert [c.args[0] for c in sleep_mock.await_args_list] == pytest.approx([2.0, 3.2, 5.12])
+
+
+class TestClassifyFiles:
+    def test_patterns_follow_rule_order_and_match_overlapping_tokens(self):
+        patterns, _fixtures = _classify_files(["src/Routest.py", "src/api/dto.py"], collect_fixtures=False)
+
+        assert patterns == [
+            "updated API client callsites",
+            "updated schema/type contracts",
+            "updated business logic adapters",
+            "updated tests/fixtures for contract compatibility",
+        ]
+
+    def test_no_patterns_for_unrelated_files(self):
+        assert _classify_files(["README.md", "docs/index.md"], collect_fixtures=True) == ([], [])
+
+    def test_collects_fixture_paths_in_same_pass(self):
+        patterns, fixtures = _classify_files(
+            ["tests/Fixtures/session.json", "src/clients/gateway.py", "tests/conftest.py"],
+            collect_fixtures=True,
+        )
+
+        assert "updated API client callsites" in patterns
+        assert fixtures == ["tests/Fixtures/session.json", "tests/conftest.py"]
+
+
+class TestExtractFixInsights:
+    def test_blank_reported_fixtures_are_not_inferred_from_changed_files(self):
+        insights = _extract_fix_insights({
+            "structured_output": {
+                "test_fixtures_changed": ["", "  "],
+                "changed_files": ["tests/fixtures/session.json", "src/clients/gateway.py"],
+            }
+        })
+
+        assert insights["test_fixtures_changed"] == []
+
+    def test_fixtures_inferred_when_none_reported(self):
+        insights = _extract_fix_insights({
+            "structured_output": {
+                "changed_files": ["tests/fixtures/session.json", "src/clients/gateway.py"],
+            }
+        })
+
+        assert insights["test_fixtures_changed"] == ["tests/fixtures/session.json"]